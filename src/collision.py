@@ -1,4 +1,5 @@
 import numpy as np
+from timegrid import densify
 
 EGO_WIDTH = 2.0
 EGO_LENGTH = 4.5
@@ -6,17 +7,49 @@ EGO_LENGTH = 4.5
 OTHER_WIDTH = 2.0
 OTHER_LENGTH = 4.5
 
+# Half-width of the x window searched around the ego in the broad phase (m).
+# Vehicles outside it are at least this far away, so must exceed the
+# largest center distance at which boxes can overlap.
+BROAD_PHASE_WINDOW = 30.0
 
-def check_collision(ego_traj, others_trajs):
+# Longest time between collision checks on a non-uniform grid (s).
+# Coarse steps are linearly interpolated down to this, so at highway
+# relative speeds (< 30 m/s) vehicles move less than one box length
+# (4.5 m) between checks and cannot pass through each other unseen.
+# Trajectories hold no t = 0 state, so the first step cannot be split:
+# timestamps with ts[0] > COLLISION_MAX_DT are rejected (ValueError).
+COLLISION_MAX_DT = 0.15
+
+
+def check_collision(ego_traj, others_trajs, broad_phase=False, timestamps=None):
     """
     ego_traj: (T, 3) array for ego [x, y, v]
     others_trajs: list of (T, 3) arrays for other cars
+    broad_phase: use sweep-and-prune candidate search (same results,
+                 much faster with many vehicles)
+    timestamps: optional (T,) state times of a non-uniform grid; steps
+                longer than COLLISION_MAX_DT are interpolated before checking
+                (ValueError if the first state is more than
+                COLLISION_MAX_DT after t = 0)
 
     Returns:
         collided: bool
         collision_t: timestep of the first collision or None
+                     (index into the original grid)
         min_distance: float (minimum center-to-center distance)
     """
+    if timestamps is not None:
+        T = ego_traj.shape[0]
+        others = np.asarray(others_trajs, dtype=float).reshape(-1, T, 3)
+        ego_dense, _, coarse_idx = densify(ego_traj, timestamps, COLLISION_MAX_DT)
+        others_dense = densify(others, timestamps, COLLISION_MAX_DT)[0]
+        collided, t, min_distance = check_collision(ego_dense, others_dense,
+                                                    broad_phase=broad_phase)
+        return collided, None if t is None else int(coarse_idx[t]), min_distance
+
+    if broad_phase:
+        return check_collision_sweep(ego_traj, others_trajs)
+
     T = ego_traj.shape[0]
 
     min_distance = float("inf")
@@ -51,3 +84,124 @@ def aabb_overlap(ex, ey, ox, oy):
     y_overlap = abs(ey - oy) < (half_w_e + half_w_o)
 
     return x_overlap and y_overlap
+
+
+def swept_candidates(ego_traj, others):
+    """
+    Conservative early reject using the swept extent of the ego trajectory.
+
+    others: (N, T, 3) array
+    Returns:
+        mask: (N,) bool, False for vehicles whose swept box never overlaps
+              the ego's swept box over the horizon (they cannot collide)
+    """
+    reach_x = (EGO_LENGTH + OTHER_LENGTH) / 2
+    reach_y = (EGO_WIDTH + OTHER_WIDTH) / 2
+    ex, ey = ego_traj[:, 0], ego_traj[:, 1]
+    ox, oy = others[:, :, 0], others[:, :, 1]
+
+    return ((ox.max(axis=1) > ex.min() - reach_x)
+            & (ox.min(axis=1) < ex.max() + reach_x)
+            & (oy.max(axis=1) > ey.min() - reach_y)
+            & (oy.min(axis=1) < ey.max() + reach_y))
+
+
+def check_collision_sweep(ego_traj, others_trajs, window=BROAD_PHASE_WINDOW):
+    """
+    Same contract and results as check_collision, with a broad phase:
+    other vehicles are sorted along x once per timestep, and only those
+    within `window` of the ego x reach the distance and box tests.
+    Vehicles that fail swept_candidates are never box-tested.
+    """
+    others = np.asarray(others_trajs, dtype=float)
+    if others.size == 0:
+        return False, None, float("inf")
+
+    T = ego_traj.shape[0]
+    ox, oy = others[:, :T, 0], others[:, :T, 1]
+    reach_x = (EGO_LENGTH + OTHER_LENGTH) / 2
+    reach_y = (EGO_WIDTH + OTHER_WIDTH) / 2
+
+    can_collide = swept_candidates(ego_traj[:T], others[:, :T])
+    any_candidate = bool(can_collide.any())
+
+    # Sorted x per timestep: (N, T)
+    order = np.argsort(ox, axis=0)
+    xs_sorted = np.take_along_axis(ox, order, axis=0)
+
+    min_distance = float("inf")
+
+    for t in range(T):
+        ex, ey, _ = ego_traj[t]
+
+        lo = np.searchsorted(xs_sorted[:, t], ex - window, side="left")
+        hi = np.searchsorted(xs_sorted[:, t], ex + window, side="right")
+        if lo == hi:
+            continue
+        idx = order[lo:hi, t]
+
+        dx = ex - ox[idx, t]
+        dy = ey - oy[idx, t]
+        dist = np.sqrt(dx**2 + dy**2)
+
+        if any_candidate:
+            hit = (np.abs(dx) < reach_x) & (np.abs(dy) < reach_y) & can_collide[idx]
+            if hit.any():
+                # Match the exhaustive loop: distances at this step only
+                # count vehicles up to the first colliding one
+                first = idx[hit].min()
+                min_distance = min(min_distance, float(dist[idx <= first].min()))
+                return True, t, min_distance
+
+        min_distance = min(min_distance, float(dist.min()))
+
+    if min_distance >= window:
+        # Nothing inside the window: every pair is far apart, compute exactly
+        dist = np.sqrt((ego_traj[:T, 0] - ox)**2 + (ego_traj[:T, 1] - oy)**2)
+        min_distance = float(dist.min())
+
+    return False, None, min_distance
+
+
+def check_collision_batch(ego_traj, rollouts):
+    """
+    check_collision for many sampled futures at once.
+
+    ego_traj: (T, 3) array for ego [x, y, v]
+    rollouts: (S, N, T, 3) array of other-vehicle futures
+
+    Returns:
+        collided: (S,) bool array
+        collision_t: (S,) int array, first collision timestep or -1
+        min_distance: (S,) array, same semantics as check_collision
+                      (counted up to and including the first colliding
+                      vehicle at the first collision step)
+    """
+    S, N, T = rollouts.shape[:3]
+    if N == 0:
+        return np.zeros(S, dtype=bool), np.full(S, -1), np.full(S, np.inf)
+
+    ego = np.asarray(ego_traj[:T], dtype=rollouts.dtype)
+    dx = ego[None, None, :, 0] - rollouts[..., 0]
+    dy = ego[None, None, :, 1] - rollouts[..., 1]
+    dist = np.sqrt(dx**2 + dy**2)
+
+    hit = ((np.abs(dx) < (EGO_LENGTH + OTHER_LENGTH) / 2)
+           & (np.abs(dy) < (EGO_WIDTH + OTHER_WIDTH) / 2))
+    del dx, dy
+
+    hit_t = hit.any(axis=1)                      # (S, T)
+    collided = hit_t.any(axis=1)                 # (S,)
+    t_first = np.where(collided, hit_t.argmax(axis=1), T)
+    n_first = hit[np.arange(S), :, np.minimum(t_first, T - 1)].argmax(axis=1)
+
+    # Distances counted by the exhaustive loop before it returns
+    t_idx = np.arange(T)[None, None, :]
+    n_idx = np.arange(N)[None, :, None]
+    counted = ((t_idx < t_first[:, None, None])
+               | ((t_idx == t_first[:, None, None])
+                  & (n_idx <= n_first[:, None, None])))
+    min_distance = np.where(counted, dist, np.inf).min(axis=(1, 2))
+
+    collision_t = np.where(collided, t_first, -1)
+    return collided, collision_t, min_distance.astype(float)
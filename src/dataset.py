@@ -0,0 +1,194 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from env import HighwayEnv
+from trajectories import generate_trajectories
+from risk import estimate_risk_streaming
+from planner import select_best_trajectory
+
+MANIFEST_FILENAME = "manifest.json"
+
+DEFAULT_SCENE_PARAMS = {
+    "n_samples": 50,
+    "dt": 0.1,
+    "horizon": 3.0,
+    "sampling": "iid",
+    "behavior": "random",
+}
+
+
+def shard_filename(shard_id):
+    return f"shard_{shard_id:05d}.npz"
+
+
+def scene_seeds(base_seed, shard_id, n_scenes):
+    """Deterministic per-scene seeds for one shard, independent of the pool layout."""
+    ss = np.random.SeedSequence([base_seed, shard_id])
+    return ss.generate_state(n_scenes, dtype=np.uint64)
+
+
+def generate_scene(seed, params=None):
+    """
+    One labelled planning scene: reset(seed) -> candidates -> risks -> scores.
+    Returns:
+        scene: dict of arrays (ego_state, others_state, collision_prob,
+               avg_min_distance, worst_min_distance, score) and 'chosen'
+    """
+    p = dict(DEFAULT_SCENE_PARAMS, **(params or {}))
+    # Independent streams for the scene layout and the Monte Carlo samples
+    scene_ss, mc_ss = np.random.SeedSequence(int(seed)).spawn(2)
+
+    env = HighwayEnv()
+    ego_state, others_state = env.reset(seed=scene_ss)
+    ego_trajs = generate_trajectories(ego_state, dt=p["dt"], horizon=p["horizon"])
+
+    rng = np.random.default_rng(mc_ss)
+    risks = [
+        estimate_risk_streaming(
+            traj, others_state, n_samples=p["n_samples"], dt=p["dt"],
+            horizon=p["horizon"], rng=rng, sampling=p["sampling"],
+            behavior=p["behavior"]
+        )
+        for traj in ego_trajs
+    ]
+    best_idx, scores = select_best_trajectory(ego_trajs, risks)
+
+    return {
+        "ego_state": ego_state,
+        "others_state": others_state,
+        "collision_prob": [r["collision_prob"] for r in risks],
+        "avg_min_distance": [r["avg_min_distance"] for r in risks],
+        "worst_min_distance": [r["worst_min_distance"] for r in risks],
+        "score": scores,
+        "chosen": best_idx,
+    }
+
+
+def build_shard(out_dir, shard_id, scenes_per_shard, base_seed=0, params=None):
+    """
+    Generate one shard and write it as a compressed .npz file.
+    The file is written under a temporary name and renamed, so a shard on
+    disk is always complete.
+    Returns:
+        (shard_id, n_scenes, elapsed_s)
+    """
+    t0 = time.perf_counter()
+    seeds = scene_seeds(base_seed, shard_id, scenes_per_shard)
+    scenes = [generate_scene(s, params) for s in seeds]
+
+    arrays = {"seed": seeds}
+    for key in scenes[0]:
+        dtype = np.int8 if key == "chosen" else np.float32
+        arrays[key] = np.array([sc[key] for sc in scenes], dtype=dtype)
+
+    path = os.path.join(out_dir, shard_filename(shard_id))
+    tmp_path = path + ".tmp.npz"
+    np.savez_compressed(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    return shard_id, len(scenes), time.perf_counter() - t0
+
+
+def load_manifest(out_dir):
+    path = os.path.join(out_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(out_dir, manifest):
+    """Atomically rewrite the manifest (the resume checkpoint)."""
+    path = os.path.join(out_dir, MANIFEST_FILENAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, mode="w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def build_dataset(out_dir, n_shards, scenes_per_shard, base_seed=0,
+                  params=None, workers=None, verbose=True):
+    """
+    Build (or resume) a sharded scene dataset in out_dir.
+
+    Shards are generated over a process pool (workers=1 runs in-process).
+    The manifest records every finished shard; shards already listed and
+    present on disk are skipped, so an interrupted job resumes where it
+    stopped. Resuming with different settings raises ValueError.
+
+    Returns:
+        stats: dict with keys 'built', 'skipped', 'scenes', 'elapsed_s',
+               'scenes_per_s'
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    config = {
+        "base_seed": base_seed,
+        "n_shards": n_shards,
+        "scenes_per_shard": scenes_per_shard,
+        "params": dict(DEFAULT_SCENE_PARAMS, **(params or {})),
+    }
+
+    manifest = load_manifest(out_dir)
+    if manifest is None:
+        manifest = {"config": config, "shards": {}}
+        save_manifest(out_dir, manifest)
+    elif manifest["config"] != config:
+        raise ValueError(
+            f"{out_dir} holds a dataset built with different settings: "
+            f"{manifest['config']}"
+        )
+
+    done = {
+        int(k) for k, v in manifest["shards"].items()
+        if os.path.exists(os.path.join(out_dir, v["file"]))
+    }
+    todo = [i for i in range(n_shards) if i not in done]
+
+    def record(shard_id, n_scenes, elapsed):
+        manifest["shards"][str(shard_id)] = {
+            "file": shard_filename(shard_id),
+            "n_scenes": n_scenes,
+            "elapsed_s": elapsed,
+        }
+        save_manifest(out_dir, manifest)
+        if verbose:
+            print(f"shard {shard_id}: {n_scenes} scenes in {elapsed:.2f} s "
+                  f"({len(manifest['shards'])}/{n_shards} done)")
+
+    t0 = time.perf_counter()
+    args = (scenes_per_shard, base_seed, config["params"])
+    if workers == 1:
+        for shard_id in todo:
+            record(*build_shard(out_dir, shard_id, *args))
+    elif todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(build_shard, out_dir, i, *args) for i in todo]
+            for fut in as_completed(futures):
+                record(*fut.result())
+    elapsed = time.perf_counter() - t0
+
+    scenes = len(todo) * scenes_per_shard
+    stats = {
+        "built": len(todo),
+        "skipped": len(done),
+        "scenes": scenes,
+        "elapsed_s": elapsed,
+        "scenes_per_s": scenes / elapsed if elapsed > 0 else 0.0,
+    }
+    if verbose:
+        print(f"Built {stats['built']} shards ({stats['skipped']} skipped): "
+              f"{scenes} scenes at {stats['scenes_per_s']:.1f} scenes/s")
+    return stats
+
+
+def load_shard(out_dir, shard_id):
+    """Load one shard as a dict of arrays."""
+    with np.load(os.path.join(out_dir, shard_filename(shard_id))) as data:
+        return {k: data[k] for k in data.files}
+
+
+if __name__ == "__main__":
+    build_dataset("dataset", n_shards=8, scenes_per_shard=25)
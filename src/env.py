@@ -1,4 +1,6 @@
 import numpy as np
+from idm import idm_accelerations
+from collision import EGO_WIDTH, EGO_LENGTH, OTHER_WIDTH, OTHER_LENGTH
 
 class Vehicle:
     def __init__(self, x, y, vx, width=2.0, length=4.5):
@@ -7,6 +9,7 @@ class Vehicle:
         self.vx = vx
         self.width = width
         self.length = length
+        self.v_desired = vx
 
     def step(self, dt, ax=0.0):
         """Move the vehicle based on acceleration ax."""
@@ -15,14 +18,25 @@ class Vehicle:
 
 
 class HighwayEnv:
-    def __init__(self, n_lanes=3, lane_width=3.5):
+    def __init__(self, n_lanes=3, lane_width=3.5, behavior="constant"):
+        """
+        behavior: 'constant' (other cars keep their speed) or 'idm'
+                  (Intelligent Driver Model car-following, ego included as a leader)
+        """
         self.n_lanes = n_lanes
         self.lane_width = lane_width
+        self.behavior = behavior
         self.ego = None
         self.others = []
 
-    def reset(self):
-        """Initialize ego vehicle and some random traffic."""
+    def reset(self, seed=None):
+        """
+        Initialize ego vehicle and some random traffic.
+        seed: optional seed for a private generator (reproducible scenes);
+              the global np.random state is used if None
+        """
+        rng = np.random if seed is None else np.random.default_rng(seed)
+
         # Ego starts in center lane
         ego_lane = self.n_lanes // 2
         ego_y = ego_lane * self.lane_width
@@ -32,8 +46,8 @@ class HighwayEnv:
         self.others = []
         for lane in range(self.n_lanes):
             for i in range(2):  # 2 vehicles per lane
-                x = np.random.uniform(20, 80)
-                vx = np.random.uniform(15, 25)
+                x = rng.uniform(20, 80)
+                vx = rng.uniform(15, 25)
                 y = lane * self.lane_width
                 self.others.append(Vehicle(x=x, y=y, vx=vx))
 
@@ -47,7 +61,136 @@ class HighwayEnv:
 
     def step(self, ego_ax, dt=0.1):
         """Step ego + others forward."""
+        others_ax = self.others_accelerations(dt)
         self.ego.step(dt, ego_ax)
-        for v in self.others:
-            v.step(dt, ax=0.0)  # other cars keep constant speed
+        for v, ax in zip(self.others, others_ax):
+            v.step(dt, ax=ax)
+        return self.get_state()
+
+    def others_accelerations(self, dt):
+        """Accelerations of the other cars for the configured behavior."""
+        if self.behavior == "constant" or not self.others:
+            return [0.0] * len(self.others)  # other cars keep constant speed
+        if self.behavior != "idm":
+            raise ValueError(f"unknown behavior: {self.behavior!r}")
+
+        # Ego is part of the traffic, so others can follow it
+        vehicles = [self.ego] + self.others
+        x = np.array([v.x for v in vehicles])
+        y = np.array([v.y for v in vehicles])
+        vx = np.array([v.vx for v in vehicles])
+        v_des = np.array([v.v_desired for v in vehicles])
+
+        ax = idm_accelerations(x, y, vx, v_des, lane_width=self.lane_width)[1:]
+        # Do not brake below standstill within one step
+        return np.maximum(ax, -vx[1:] / dt)
+
+
+class VecHighwayEnv:
+    """
+    E independent highway instances stored in batched arrays.
+
+    Each instance has its own generator (spawned from one seed), so its
+    episodes are reproducible regardless of when the others reset. The
+    first episode of instance i matches HighwayEnv().reset(seed=seeds[i]).
+    Episodes end on an ego collision (terminated) or after max_steps
+    (truncated), and finished instances are reset automatically inside
+    step(); their last state is returned in the step info.
+    """
+
+    def __init__(self, n_envs, n_lanes=3, lane_width=3.5, behavior="constant",
+                 max_steps=300, seed=None, vehicles_per_lane=2):
+        self.n_envs = n_envs
+        self.n_lanes = n_lanes
+        self.lane_width = lane_width
+        self.behavior = behavior
+        self.max_steps = max_steps
+        self.n_others = n_lanes * vehicles_per_lane
+
+        self.seeds = np.random.SeedSequence(seed).spawn(n_envs)
+        self.rngs = [np.random.default_rng(s) for s in self.seeds]
+
+        self.ego = np.zeros((n_envs, 3))
+        self.others = np.zeros((n_envs, self.n_others, 3))
+        self.v_desired = np.zeros((n_envs, self.n_others + 1))
+        self.steps = np.zeros(n_envs, dtype=int)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Reset the instances selected by mask (all if None)."""
+        idx = np.arange(self.n_envs) if mask is None else np.flatnonzero(mask)
+        lanes = np.repeat(np.arange(self.n_lanes), self.n_others // self.n_lanes)
+
+        for i in idx:
+            # Same draw order as HighwayEnv.reset: x then vx per vehicle
+            u = self.rngs[i].random((self.n_others, 2))
+            self.others[i, :, 0] = 20.0 + 60.0 * u[:, 0]
+            self.others[i, :, 1] = lanes * self.lane_width
+            self.others[i, :, 2] = 15.0 + 10.0 * u[:, 1]
+
+        self.ego[idx] = [0.0, (self.n_lanes // 2) * self.lane_width, 20.0]
+        self.v_desired[idx, 0] = self.ego[idx, 2]
+        self.v_desired[idx, 1:] = self.others[idx, :, 2]
+        self.steps[idx] = 0
         return self.get_state()
+
+    def get_state(self):
+        """Batched observations: ego (E, 3) and others (E, M, 3)."""
+        return self.ego.copy(), self.others.copy()
+
+    def collisions(self):
+        """(E,) bool, ego box overlapping any other vehicle."""
+        dx = np.abs(self.others[:, :, 0] - self.ego[:, None, 0])
+        dy = np.abs(self.others[:, :, 1] - self.ego[:, None, 1])
+        # Same box overlap test as collision.check_collision
+        hit = ((dx < (EGO_LENGTH + OTHER_LENGTH) / 2)
+               & (dy < (EGO_WIDTH + OTHER_WIDTH) / 2))
+        return hit.any(axis=1)
+
+    def step(self, ego_ax, dt=0.1):
+        """
+        Step every instance with its ego acceleration (scalar or (E,)).
+
+        Returns:
+            ego_states: (E, 3), others_states: (E, M, 3)
+            terminated: (E,) bool, episode ended in an ego collision
+            truncated: (E,) bool, episode hit max_steps without a collision
+            info: dict with 'final_ego' (E, 3) and 'final_others' (E, M, 3),
+                  the states reached by this step before any reset
+            Instances with terminated | truncated were reset, and their
+            returned state is the first state of the new episode.
+        """
+        ego_ax = np.broadcast_to(np.asarray(ego_ax, dtype=float), (self.n_envs,))
+        others_ax = self.others_accelerations(dt)
+
+        # Same update order as Vehicle.step
+        self.ego[:, 2] += ego_ax * dt
+        self.ego[:, 0] += self.ego[:, 2] * dt
+        self.others[:, :, 2] += others_ax * dt
+        self.others[:, :, 0] += self.others[:, :, 2] * dt
+        self.steps += 1
+
+        terminated = self.collisions()
+        truncated = (self.steps >= self.max_steps) & ~terminated
+        final_ego, final_others = self.get_state()
+        dones = terminated | truncated
+        if dones.any():
+            self.reset(dones)
+        ego_states, others_states = self.get_state()
+        info = {"final_ego": final_ego, "final_others": final_others}
+        return ego_states, others_states, terminated, truncated, info
+
+    def others_accelerations(self, dt):
+        """(E, M) accelerations of the other cars for the configured behavior."""
+        if self.behavior == "constant":
+            return np.zeros((self.n_envs, self.n_others))
+        if self.behavior != "idm":
+            raise ValueError(f"unknown behavior: {self.behavior!r}")
+
+        # Ego is part of the traffic, so others can follow it
+        vehicles = np.concatenate([self.ego[:, None, :], self.others], axis=1)
+        ax = idm_accelerations(vehicles[..., 0], vehicles[..., 1],
+                               vehicles[..., 2], self.v_desired,
+                               lane_width=self.lane_width)[:, 1:]
+        # Do not brake below standstill within one step
+        return np.maximum(ax, -self.others[:, :, 2] / dt)
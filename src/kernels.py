@@ -0,0 +1,208 @@
+import os
+import time
+
+import numpy as np
+
+from collision import (check_collision_batch, EGO_WIDTH, EGO_LENGTH,
+                       OTHER_WIDTH, OTHER_LENGTH)
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+# Environment variable overriding the default backend choice
+BACKEND_ENV_VAR = "RISK_KERNEL_BACKEND"
+
+
+class KernelBackend:
+    """
+    The two hot kernels of the Monte Carlo risk estimator.
+
+    integrate_rollouts(state, accels, dt) -> (S, N, T, 3) rollouts
+        state: (N, 3) initial [x, y, v]; accels: (S, N, T)
+        dt: scalar step or (T,) step sizes of a non-uniform grid
+        v is clamped at 0 before integrating x, as in simulate_others_rollout
+    first_collision(ego_traj, rollouts) -> (collided, collision_t, min_distance)
+        same contract as collision.check_collision_batch
+    """
+
+    def __init__(self, name, integrate_rollouts, first_collision):
+        self.name = name
+        self.integrate_rollouts = integrate_rollouts
+        self.first_collision = first_collision
+
+    def __repr__(self):
+        return f"KernelBackend({self.name!r})"
+
+
+def integrate_rollouts_numpy(state, accels, dt):
+    """Clamped velocity integration, vectorized over samples and vehicles."""
+    S, N, T = accels.shape
+    state = np.asarray(state, dtype=accels.dtype)
+    dts = np.broadcast_to(np.asarray(dt, dtype=accels.dtype), (T,))
+
+    x = np.repeat(state[None, :, 0], S, axis=0)
+    v = np.repeat(state[None, :, 2], S, axis=0)
+
+    rollouts = np.empty((S, N, T, 3), dtype=accels.dtype)
+    rollouts[:, :, :, 1] = state[None, :, 1, None]
+
+    for t in range(T):
+        v = np.maximum(0.0, v + accels[:, :, t] * dts[t])
+        x = x + v * dts[t]
+        rollouts[:, :, t, 0] = x
+        rollouts[:, :, t, 2] = v
+
+    return rollouts
+
+
+NUMPY_BACKEND = KernelBackend("numpy", integrate_rollouts_numpy,
+                              check_collision_batch)
+BACKENDS = {"numpy": NUMPY_BACKEND}
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _integrate_rollouts_numba(state, accels, dts):
+        S, N, T = accels.shape
+        rollouts = np.empty((S, N, T, 3), dtype=accels.dtype)
+        for s in numba.prange(S):
+            for n in range(N):
+                x = state[n, 0]
+                y = state[n, 1]
+                v = state[n, 2]
+                for t in range(T):
+                    v = max(0.0, v + accels[s, n, t] * dts[t])
+                    x += v * dts[t]
+                    rollouts[s, n, t, 0] = x
+                    rollouts[s, n, t, 1] = y
+                    rollouts[s, n, t, 2] = v
+        return rollouts
+
+    @numba.njit(parallel=True, cache=True)
+    def _first_collision_numba(ego, rollouts, reach_x, reach_y):
+        S, N, T = rollouts.shape[0], rollouts.shape[1], rollouts.shape[2]
+        T = min(T, ego.shape[0])
+        collided = np.zeros(S, dtype=np.bool_)
+        collision_t = np.full(S, -1, dtype=np.int64)
+        min_distance = np.full(S, np.inf)
+        for s in numba.prange(S):
+            best = np.inf
+            done = False
+            for t in range(T):
+                ex = ego[t, 0]
+                ey = ego[t, 1]
+                for n in range(N):
+                    dx = ex - rollouts[s, n, t, 0]
+                    dy = ey - rollouts[s, n, t, 1]
+                    d = np.sqrt(dx * dx + dy * dy)
+                    if d < best:
+                        best = d
+                    if abs(dx) < reach_x and abs(dy) < reach_y:
+                        collided[s] = True
+                        collision_t[s] = t
+                        done = True
+                        break
+                if done:
+                    break
+            min_distance[s] = best
+        return collided, collision_t, min_distance
+
+    def integrate_rollouts_numba(state, accels, dt):
+        """Loop-fused JIT version of integrate_rollouts_numpy."""
+        T = accels.shape[2]
+        return _integrate_rollouts_numba(
+            np.ascontiguousarray(state, dtype=accels.dtype),
+            np.ascontiguousarray(accels),
+            np.ascontiguousarray(np.broadcast_to(np.asarray(dt, dtype=float), (T,)))
+        )
+
+    def first_collision_numba(ego_traj, rollouts):
+        """JIT first-collision search with early exit per sample."""
+        return _first_collision_numba(
+            np.ascontiguousarray(ego_traj, dtype=np.float64),
+            np.ascontiguousarray(rollouts),
+            (EGO_LENGTH + OTHER_LENGTH) / 2,
+            (EGO_WIDTH + OTHER_WIDTH) / 2,
+        )
+
+    BACKENDS["numba"] = KernelBackend("numba", integrate_rollouts_numba,
+                                      first_collision_numba)
+
+
+def get_backend(name=None):
+    """
+    Resolve a kernel backend at runtime.
+
+    name: 'numpy', 'numba', 'auto' or None. None reads RISK_KERNEL_BACKEND
+          and defaults to 'auto', which picks the compiled backend when
+          numba is installed and falls back to NumPy otherwise.
+    """
+    if isinstance(name, KernelBackend):
+        return name
+    if name is None:
+        name = os.environ.get(BACKEND_ENV_VAR, "auto")
+    if name == "auto":
+        return BACKENDS.get("numba", NUMPY_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(
+            f"kernel backend {name!r} is not available "
+            f"(available: {sorted(BACKENDS)})"
+        )
+    return BACKENDS[name]
+
+
+def benchmark_backends(n_samples=2000, n_others=100, dt=0.1, horizon=3.0,
+                       repeats=3, seed=0):
+    """
+    Time both kernels on every available backend with the same inputs.
+
+    Returns:
+        results: dict backend name -> dict with keys
+            'rollout_s', 'collision_s' (best of `repeats`, seconds)
+            'speedup' (total NumPy time / total time of this backend)
+    """
+    rng = np.random.default_rng(seed)
+    T = int(horizon / dt)
+    state = np.column_stack([
+        rng.uniform(-50, 150, n_others),
+        rng.integers(0, 3, n_others) * 3.5,
+        rng.uniform(15, 25, n_others),
+    ])
+    accels = rng.choice([-2.0, 0.0, 1.0], p=[0.2, 0.6, 0.2],
+                        size=(n_samples, n_others, T))
+    x = np.cumsum(np.full(T, 20.0 * dt))
+    ego_traj = np.column_stack([x, np.full(T, 3.5), np.full(T, 20.0)])
+
+    results = {}
+    for name, backend in BACKENDS.items():
+        # Warm-up call (triggers JIT compilation)
+        rollouts = backend.integrate_rollouts(state, accels, dt)
+        backend.first_collision(ego_traj, rollouts)
+
+        rollout_s = collision_s = float("inf")
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            rollouts = backend.integrate_rollouts(state, accels, dt)
+            t1 = time.perf_counter()
+            backend.first_collision(ego_traj, rollouts)
+            t2 = time.perf_counter()
+            rollout_s = min(rollout_s, t1 - t0)
+            collision_s = min(collision_s, t2 - t1)
+        results[name] = {"rollout_s": rollout_s, "collision_s": collision_s}
+
+    base = results["numpy"]["rollout_s"] + results["numpy"]["collision_s"]
+    for r in results.values():
+        r["speedup"] = base / (r["rollout_s"] + r["collision_s"])
+    return results
+
+
+if __name__ == "__main__":
+    for name, r in benchmark_backends().items():
+        print(
+            f"{name:>6}: rollout={r['rollout_s'] * 1e3:.1f} ms, "
+            f"collision={r['collision_s'] * 1e3:.1f} ms, "
+            f"speedup={r['speedup']:.1f}x"
+        )
@@ -0,0 +1,248 @@
+# src/live_dashboard.py
+
+import csv
+import io
+import os
+import queue
+import time
+from collections import deque
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from logger import LOG_DIR, SUMMARY_FILENAME, summary_record
+
+WINDOW = 300          # planning cycles kept per rolling window
+REFRESH_S = 0.2       # minimum time between redraws
+MANEUVERS = ["keep", "brake", "lane_left", "lane_right"]
+
+
+class SummaryTailer:
+    """
+    Incrementally reads new rows from the summary CSV.
+
+    Only complete lines are consumed (a row being written stays for the
+    next poll), and one event is emitted per planning cycle, from the row
+    of the chosen trajectory.
+
+    When the file is replaced (the logger migrating an old header), it is
+    re-read under the new header, skipping the rows already consumed.
+    """
+
+    def __init__(self, summary_path=None):
+        if summary_path is None:
+            summary_path = os.path.join(LOG_DIR, SUMMARY_FILENAME)
+        self.summary_path = summary_path
+        self.offset = 0
+        self.header = None
+        self.inode = None
+        self.n_rows = 0
+        self.skip_rows = 0
+
+    def poll(self):
+        if not os.path.exists(self.summary_path):
+            return []
+
+        with open(self.summary_path, mode="rb") as f:
+            st = os.fstat(f.fileno())
+            if self.inode is not None and (st.st_ino != self.inode
+                                           or st.st_size < self.offset):
+                self.offset = 0
+                self.header = None
+                self.skip_rows = self.n_rows
+            self.inode = st.st_ino
+            f.seek(self.offset)
+            chunk = f.read()
+
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return []
+        self.offset += end
+        text = chunk[:end].decode("utf-8")
+
+        events = []
+        for row in csv.reader(io.StringIO(text, newline="")):
+            if self.header is None:
+                self.header = row
+                continue
+            if self.skip_rows:
+                self.skip_rows -= 1
+                continue
+            self.n_rows += 1
+            rec = summary_record(self.header, row)
+            if rec.get("chosen") != "1":
+                continue
+            events.append({
+                "run_id": rec.get("run_id"),
+                "latency_ms": to_float(rec.get("latency_ms")),
+                "collision_prob": to_float(rec.get("collision_prob")),
+                "maneuver": rec.get("traj_type", ""),
+            })
+        return events
+
+
+class QueueSource:
+    """Non-blocking reader for events pushed by the planner into a queue."""
+
+    def __init__(self, q, max_batch=1000):
+        self.q = q
+        self.max_batch = max_batch
+
+    def poll(self):
+        events = []
+        try:
+            while len(events) < self.max_batch:
+                events.append(self.q.get_nowait())
+        except queue.Empty:
+            pass
+        return events
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class LiveDashboard:
+    """
+    Live 4-panel monitor over rolling windows of planning cycles:
+    latency, collision probability of the chosen trajectory, chosen
+    maneuver over time, and maneuver counts in the window.
+
+    Artists are created once and updated in place; frames are drawn by
+    blitting onto a cached background. The background is only rebuilt
+    when an axis has to be rescaled. Memory is bounded by `window`.
+    """
+
+    def __init__(self, window=WINDOW, refresh_s=REFRESH_S):
+        self.window = window
+        self.refresh_s = refresh_s
+        self.cycle = 0
+        self.last_draw = 0.0
+
+        self.steps = deque(maxlen=window)
+        self.latency = deque(maxlen=window)
+        self.collision_prob = deque(maxlen=window)
+        self.maneuver = deque(maxlen=window)
+
+        self.fig, axs = plt.subplots(2, 2, figsize=(12, 8))
+        self.axs = axs.flatten()
+
+        self.axs[0].set_title("Planning Latency")
+        self.axs[0].set_ylabel("ms")
+        self.axs[1].set_title("Collision Prob (Chosen Trajectory)")
+        self.axs[1].set_ylim(0.0, 1.0)
+        self.axs[2].set_title("Chosen Maneuver")
+        self.axs[2].set_yticks(range(len(MANEUVERS)))
+        self.axs[2].set_yticklabels(MANEUVERS)
+        self.axs[2].set_ylim(-0.5, len(MANEUVERS) - 0.5)
+        self.axs[3].set_title("Maneuver Counts (Window)")
+        self.axs[3].set_ylim(0, window)
+        for ax in self.axs[:3]:
+            ax.set_xlabel("Planning cycle")
+            ax.set_xlim(0, window)
+            ax.grid(True)
+
+        self.latency_line, = self.axs[0].plot([], [], color="tab:blue",
+                                              animated=True)
+        self.prob_line, = self.axs[1].plot([], [], color="tab:red",
+                                           animated=True)
+        self.maneuver_dots, = self.axs[2].plot([], [], ".", color="tab:green",
+                                               animated=True)
+        self.bars = self.axs[3].bar(MANEUVERS, np.zeros(len(MANEUVERS)),
+                                    color="tab:gray")
+        for b in self.bars:
+            b.set_animated(True)
+
+        self.fig.tight_layout()
+        self.background = None
+        self.fig.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def artists(self):
+        return [self.latency_line, self.prob_line, self.maneuver_dots,
+                *self.bars]
+
+    def on_draw(self, event=None):
+        """Cache the static background after any full redraw."""
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for a in self.artists():
+            self.fig.draw_artist(a)
+
+    def push(self, events):
+        """Add events (dicts with latency_ms, collision_prob, maneuver)."""
+        for ev in events:
+            self.cycle += 1
+            self.steps.append(self.cycle)
+            self.latency.append(ev.get("latency_ms", float("nan")))
+            self.collision_prob.append(ev.get("collision_prob", float("nan")))
+            m = ev.get("maneuver", "")
+            self.maneuver.append(MANEUVERS.index(m) if m in MANEUVERS else -1)
+
+    def update(self, events=(), force=False):
+        """Push events and redraw if the refresh interval has elapsed."""
+        self.push(events)
+        now = time.perf_counter()
+        if not force and now - self.last_draw < self.refresh_s:
+            return False
+        self.last_draw = now
+
+        steps = np.fromiter(self.steps, dtype=float)
+        latency = np.fromiter(self.latency, dtype=float)
+        maneuver = np.fromiter(self.maneuver, dtype=float)
+
+        self.latency_line.set_data(steps, latency)
+        self.prob_line.set_data(steps, np.fromiter(self.collision_prob,
+                                                   dtype=float))
+        self.maneuver_dots.set_data(steps, maneuver)
+        counts = np.bincount(maneuver[maneuver >= 0].astype(int),
+                             minlength=len(MANEUVERS))
+        for b, c in zip(self.bars, counts):
+            b.set_height(c)
+
+        if self.rescale(steps, latency) or self.background is None:
+            # Full redraw; on_draw caches the new background
+            self.fig.canvas.draw()
+        else:
+            canvas = self.fig.canvas
+            canvas.restore_region(self.background)
+            for a in self.artists():
+                self.fig.draw_artist(a)
+            canvas.blit(self.fig.bbox)
+        self.fig.canvas.flush_events()
+        return True
+
+    def rescale(self, steps, latency):
+        """Adjust axis limits in coarse jumps; True if anything changed."""
+        changed = False
+        if len(steps):
+            lo = max(0, steps[-1] - self.window)
+            if steps[-1] > self.axs[0].get_xlim()[1]:
+                for ax in self.axs[:3]:
+                    ax.set_xlim(lo, lo + 1.5 * self.window)
+                changed = True
+        finite = latency[np.isfinite(latency)]
+        if len(finite):
+            top = self.axs[0].get_ylim()[1]
+            peak = finite.max()
+            if peak > top or peak < 0.25 * top:
+                self.axs[0].set_ylim(0, 1.5 * peak if peak > 0 else 1.0)
+                changed = True
+        return changed
+
+    def run(self, source, poll_s=0.05, max_runtime_s=None):
+        """Poll a source (SummaryTailer / QueueSource) until the window closes."""
+        plt.show(block=False)
+        self.fig.canvas.draw()
+        start = time.perf_counter()
+        while plt.fignum_exists(self.fig.number):
+            self.update(source.poll())
+            if max_runtime_s is not None and time.perf_counter() - start > max_runtime_s:
+                break
+            plt.pause(poll_s)
+
+
+if __name__ == "__main__":
+    # Run in its own process next to the planner, tailing logs/summary.csv
+    LiveDashboard().run(SummaryTailer())
@@ -4,6 +4,8 @@ import os
 from datetime import datetime
 import json
 
+import numpy as np
+
 LOG_DIR = "logs"
 SUMMARY_FILENAME = "summary.csv"
 
@@ -13,7 +15,13 @@ SUMMARY_HEADER = [
     "n_other", "horizon_s", "dt_s",
     "traj_id", "traj_type",
     "collision_prob", "avg_min_distance", "worst_min_distance",
-    "score", "chosen", "notes"
+    "score", "chosen", "notes", "comfort_cost", "latency_ms"
+]
+
+# Per-trajectory numeric columns returned by load_summary_runs
+RUN_COLUMNS = [
+    "traj_id", "collision_prob", "avg_min_distance", "worst_min_distance",
+    "score", "chosen", "comfort_cost"
 ]
 
 
@@ -23,16 +31,51 @@ def ensure_log_dir():
 
 
 def init_summary_if_needed():
-    """Create summary CSV with header if missing."""
+    """Create summary CSV with header if missing, migrate an old header."""
     ensure_log_dir()
     summary_path = os.path.join(LOG_DIR, SUMMARY_FILENAME)
     if not os.path.exists(summary_path):
         with open(summary_path, mode="w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(SUMMARY_HEADER)
+    else:
+        migrate_summary(summary_path)
     return summary_path
 
 
+def summary_record(header, row):
+    """
+    Map one summary CSV row to a dict keyed by column name.
+    header: the file's own header row. Rows longer than an older header
+    (appended before a migration existed) follow SUMMARY_HEADER order.
+    """
+    if len(row) > len(header) and header == SUMMARY_HEADER[:len(header)]:
+        header = SUMMARY_HEADER
+    return dict(zip(header, row))
+
+
+def migrate_summary(summary_path):
+    """
+    Rewrite a summary CSV whose header differs from SUMMARY_HEADER.
+    Existing rows keep their values; new columns are left empty. The file
+    is replaced atomically. Returns True if the file was rewritten.
+    """
+    with open(summary_path, newline="") as f:
+        header = next(csv.reader(f), None)
+        if header == SUMMARY_HEADER:
+            return False
+        rows = [summary_record(header or [], row) for row in csv.reader(f)]
+
+    tmp_path = summary_path + ".tmp"
+    with open(tmp_path, mode="w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SUMMARY_HEADER)
+        for rec in rows:
+            writer.writerow([rec.get(k, "") for k in SUMMARY_HEADER])
+    os.replace(tmp_path, summary_path)
+    return True
+
+
 def append_summary_row(row_dict):
     """
     Append a single row (dict) to the summary CSV.
@@ -57,3 +100,37 @@ def save_detail_json(run_id, detail_obj):
     with open(detail_path, mode="a", encoding="utf-8") as f:
         f.write(json.dumps(detail_obj) + "\n")
     return detail_path
+
+
+def load_summary_runs(summary_path=None):
+    """
+    Read the summary CSV back, grouped by run.
+    Returns:
+        runs: dict run_id -> dict column -> (K,) float array for RUN_COLUMNS,
+              rows ordered by traj_id; missing values become NaN
+    """
+    if summary_path is None:
+        summary_path = os.path.join(LOG_DIR, SUMMARY_FILENAME)
+
+    grouped = {}
+    with open(summary_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        for row in reader:
+            rec = summary_record(header, row)
+            grouped.setdefault(rec["run_id"], []).append(rec)
+
+    def to_float(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float("nan")
+
+    runs = {}
+    for run_id, rows in grouped.items():
+        rows.sort(key=lambda r: to_float(r["traj_id"]))
+        runs[run_id] = {
+            col: np.array([to_float(r.get(col)) for r in rows])
+            for col in RUN_COLUMNS
+        }
+    return runs
@@ -0,0 +1,117 @@
+import numpy as np
+
+from collision import COLLISION_MAX_DT, check_collision
+from kernels import get_backend
+from planner import comfort_costs, score_matrix, stack_risks
+from risk import simulate_others_rollouts
+from sampling import sample_uniforms
+from timegrid import densify, resolve_time_grid
+from trajectories import generate_trajectories
+
+
+def risks_from_rollouts(ego_trajs, rollouts, backend=None, timestamps=None):
+    """
+    Risk dicts for candidate trajectories against a pool of sampled futures
+    of the other vehicles (n_samples, N, T, 3), shared by all candidates.
+    timestamps: optional (T,) state times of a non-uniform grid; coarse
+                steps are interpolated to COLLISION_MAX_DT, as in check_collision
+    """
+    backend = get_backend(backend)
+    if timestamps is not None:
+        rollouts = densify(rollouts, timestamps, COLLISION_MAX_DT)[0]
+    risks = []
+    for ego_traj in ego_trajs:
+        if timestamps is not None:
+            ego_traj = densify(ego_traj, timestamps, COLLISION_MAX_DT)[0]
+        collided, _, min_dists = backend.first_collision(ego_traj, rollouts)
+        risks.append({
+            "collision_prob": float(collided.mean()) if len(collided) else 0.0,
+            "avg_min_distance": float(min_dists.mean()) if len(min_dists) else float("inf"),
+            "worst_min_distance": float(min_dists.min()) if len(min_dists) else float("inf"),
+        })
+    return risks
+
+
+def ego_conflict(traj_a, traj_b, timestamps=None):
+    """True if two ego trajectories overlap at some timestep."""
+    return check_collision(traj_a, [traj_b], timestamps=timestamps)[0]
+
+
+def plan_multi_ego(ego_states, others_initial_state, n_samples=100,
+                   dt=0.1, horizon=3.0, rng=None, sampling="iid",
+                   behavior="random", weights=None, backend=None,
+                   lane_width=3.5, timestamps=None):
+    """
+    Joint planning for several automated vehicles in one scene.
+
+    The background traffic is simulated once (n_samples futures) and every
+    ego's candidate set is evaluated against that shared pool, so only the
+    collision stage grows with egos x candidates. Egos are then resolved in
+    priority order (list order): each ego takes its best-scoring candidate
+    that does not conflict with the candidates already chosen for
+    higher-priority egos. If every candidate conflicts, the best-scoring
+    one is kept and the conflict is reported.
+
+    timestamps: optional (T,) state times for a non-uniform grid, used by
+                every stage (overrides dt and horizon)
+
+    Returns:
+        plan: dict with keys
+            'candidates': list (per ego) of candidate trajectories
+            'risks': list (per ego) of risk_info dicts per candidate
+            'scores': list (per ego) of (K,) score arrays
+            'chosen': list of chosen candidate index per ego
+            'conflicts': list of (i, j) ego pairs whose chosen
+                         trajectories still overlap
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    _, dts = resolve_time_grid(dt, horizon, timestamps)
+    N = len(others_initial_state)
+    U = sample_uniforms(n_samples, N * len(dts), mode=sampling, rng=rng)
+    rollouts = simulate_others_rollouts(
+        others_initial_state, n_samples, dt=dt, horizon=horizon, rng=rng,
+        uniforms=U, behavior=behavior, lane_width=lane_width, backend=backend,
+        timestamps=timestamps
+    )
+
+    candidates, risks, scores = [], [], []
+    for ego_state in ego_states:
+        trajs = generate_trajectories(ego_state, lane_width=lane_width,
+                                      dt=dt, horizon=horizon,
+                                      timestamps=timestamps)
+        r = risks_from_rollouts(trajs, rollouts, backend, timestamps)
+        p, avg_d = stack_risks(r)
+        sc, _ = score_matrix(p, avg_d, comfort_costs(trajs, timestamps),
+                             weights)
+        candidates.append(trajs)
+        risks.append(r)
+        scores.append(sc[0])
+
+    chosen, conflicts = [], []
+    for e, (trajs, sc) in enumerate(zip(candidates, scores)):
+        order = np.argsort(sc, kind="stable")
+        pick = None
+        for k in order:
+            if not any(ego_conflict(trajs[k], candidates[j][chosen[j]],
+                                    timestamps)
+                       for j in range(e)):
+                pick = int(k)
+                break
+        if pick is None:
+            pick = int(order[0])
+            conflicts.extend(
+                (j, e) for j in range(e)
+                if ego_conflict(trajs[pick], candidates[j][chosen[j]],
+                                timestamps)
+            )
+        chosen.append(pick)
+
+    return {
+        "candidates": candidates,
+        "risks": risks,
+        "scores": scores,
+        "chosen": chosen,
+        "conflicts": conflicts,
+    }
@@ -1,23 +1,37 @@
 import numpy as np
 
-def trajectory_comfort_cost(ego_traj):
+def trajectory_comfort_cost(ego_traj, timestamps=None):
     """
     Simple comfort cost: sum of absolute acceleration (approximate).
     Lower is better.
+    timestamps: optional (T,) state times of a non-uniform grid. The cost is
+    then the mean per-step acceleration |dv / dt| times the time span of the
+    trajectory, so every step counts once whatever its length: a speed change
+    squeezed into a fine step costs more than the same change over a coarse
+    one. Same units (m/s) as the uniform cost, which it equals on a uniform
+    grid (and for any constant-acceleration profile).
     """
     vs = ego_traj[:, 2]
     accs = np.diff(vs)  # v[t+1] - v[t]
-    return float(np.sum(np.abs(accs)))
+    if timestamps is None:
+        return float(np.sum(np.abs(accs)))
+    if len(accs) == 0:
+        return 0.0
 
-def compute_score(risk_info, ego_traj, weights=None):
+    ts = np.asarray(timestamps, dtype=float)[:len(vs)]
+    step = np.diff(ts)
+    return float(np.mean(np.abs(accs / step)) * (ts[-1] - ts[0]))
+
+def compute_score(risk_info, ego_traj, weights=None, timestamps=None):
     """
     Compute a scalar score for a trajectory. Lower score = better.
     risk_info: dict with keys 'collision_prob', 'avg_min_distance'
     ego_traj: (T,3)
     weights: dict with keys 'p', 'd', 'c' (probability, distance, comfort)
+    timestamps: optional time grid of ego_traj (see trajectory_comfort_cost)
     """
     if weights is None:
-        weights = {'p': 1.0, 'd': 0.5, 'c': 0.1}
+        weights = DEFAULT_WEIGHTS
 
     p = risk_info.get('collision_prob', 0.0)
     avg_d = risk_info.get('avg_min_distance', 1e6)
@@ -25,20 +39,94 @@ def compute_score(risk_info, ego_traj, weights=None):
     # We want lower score for lower p, larger avg_d, lower comfort cost
     # Normalize distance by a scale (e.g. 10 m)
     dist_term = 1.0 / max(avg_d, 1e-3)  # higher when avg_d is small
-    comfort = trajectory_comfort_cost(ego_traj)
+    comfort = trajectory_comfort_cost(ego_traj, timestamps)
 
     score = weights['p'] * p + weights['d'] * dist_term + weights['c'] * (comfort / 10.0)
     return score
 
-def select_best_trajectory(ego_trajs, risks, weights=None):
+def select_best_trajectory(ego_trajs, risks, weights=None, timestamps=None):
     """
     ego_trajs: list of trajectories (np arrays)
     risks: list of risk_info dicts, same order
+    timestamps: optional time grid of the trajectories
     returns: index_of_best, scores (list)
     """
-    scores = []
-    for traj, risk in zip(ego_trajs, risks):
-        sc = compute_score(risk, traj, weights)
-        scores.append(sc)
-    best_idx = int(np.argmin(scores))
-    return best_idx, scores
+    p, avg_d = stack_risks(risks)
+    scores, best = score_matrix(p, avg_d, comfort_costs(ego_trajs, timestamps), weights)
+    return int(best[0]), scores[0].tolist()
+
+
+DEFAULT_WEIGHTS = {'p': 1.0, 'd': 0.5, 'c': 0.1}
+
+
+def comfort_costs(ego_trajs, timestamps=None):
+    """Comfort cost for each candidate, computed once: (K,) array."""
+    return np.array([trajectory_comfort_cost(traj, timestamps) for traj in ego_trajs])
+
+
+def stack_risks(risks):
+    """
+    Stack a list of risk_info dicts into arrays.
+    Returns:
+        collision_prob: (K,) array
+        avg_min_distance: (K,) array
+    """
+    p = np.array([r.get('collision_prob', 0.0) for r in risks], dtype=float)
+    avg_d = np.array([r.get('avg_min_distance', 1e6) for r in risks], dtype=float)
+    return p, avg_d
+
+
+def weights_to_array(weights):
+    """
+    Convert weights to a (W, 3) array of (p, d, c) columns.
+    weights: None, a single {'p','d','c'} dict, a list of such dicts,
+             or an array of shape (3,) or (W, 3)
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    if isinstance(weights, dict):
+        weights = [weights]
+    if len(weights) and isinstance(weights[0], dict):
+        weights = [[w['p'], w['d'], w['c']] for w in weights]
+    return np.atleast_2d(np.asarray(weights, dtype=float))
+
+
+def score_matrix(collision_prob, avg_min_distance, comfort, weights=None):
+    """
+    Vectorized compute_score for K candidates and W weight vectors.
+
+    collision_prob, avg_min_distance, comfort: (K,) arrays (or (R, K) for
+        R logged runs, in which case the result is (W, R, K))
+    weights: see weights_to_array
+    Returns:
+        scores: (W, K) array, same values as compute_score
+        best_idx: (W,) int array, argmin over candidates per weight vector
+    """
+    w = weights_to_array(weights)
+    terms = np.stack([
+        np.asarray(collision_prob, dtype=float),
+        1.0 / np.maximum(avg_min_distance, 1e-3),
+        np.asarray(comfort, dtype=float) / 10.0,
+    ], axis=-1)  # (..., K, 3)
+
+    scores = np.tensordot(w, terms, axes=([1], [terms.ndim - 1]))
+    best_idx = np.argmin(scores, axis=-1)
+    return scores, best_idx
+
+
+def pareto_front(collision_prob, avg_min_distance, comfort):
+    """
+    Indices of non-dominated candidates when minimizing
+    (collision_prob, 1 / avg_min_distance, comfort).
+    A candidate is dominated if another one is no worse in every
+    objective and strictly better in at least one.
+    """
+    obj = np.column_stack([
+        np.asarray(collision_prob, dtype=float),
+        1.0 / np.maximum(avg_min_distance, 1e-3),
+        np.asarray(comfort, dtype=float),
+    ])
+    no_worse = (obj[:, None, :] <= obj[None, :, :]).all(axis=2)
+    better = (obj[:, None, :] < obj[None, :, :]).any(axis=2)
+    dominated = (no_worse & better).any(axis=0)
+    return np.flatnonzero(~dominated)
@@ -1,34 +1,51 @@
 import numpy as np
 from collision import check_collision
+from idm import idm_accelerations
+from kernels import get_backend
+from sampling import ACCEL_CHOICES, ACCEL_PROBS, sample_uniforms, uniforms_to_accels
+from timegrid import resolve_time_grid, densify
+from collision import COLLISION_MAX_DT
 
 
-def simulate_others_rollout(others_initial_state, dt=0.1, horizon=3.0, rng=None):
+def simulate_others_rollout(others_initial_state, dt=0.1, horizon=3.0, rng=None,
+                            uniforms=None, timestamps=None):
     """
     Simulate one possible future for all other vehicles with random accelerations.
     others_initial_state: (N, 3) array of [x, y, v] for each vehicle at t=0
+    uniforms: optional (N, T) array in [0, 1) driving the acceleration choices
+              (used by the variance-reduced sampling modes); drawn from rng if None
+    timestamps: optional (T,) state times for a non-uniform grid
+                (overrides dt and horizon)
     Returns:
         others_trajs: list of (T, 3) arrays for each other vehicle
     """
     if rng is None:
         rng = np.random.default_rng()
 
-    T = int(horizon / dt)
+    _, dts = resolve_time_grid(dt, horizon, timestamps)
+    T = len(dts)
     others_trajs = []
 
-    for ox0, oy0, ov0 in others_initial_state:
+    if uniforms is not None:
+        accels = uniforms_to_accels(np.asarray(uniforms).reshape(-1, T))
+
+    for i, (ox0, oy0, ov0) in enumerate(others_initial_state):
         x = ox0
         y = oy0
         v = ov0
         traj = []
 
-        for _ in range(T):
+        for t in range(T):
             # Sample random acceleration: bias toward maintaining speed
             # values in m/s^2
-            ax = rng.choice([-2.0, 0.0, 1.0], p=[0.2, 0.6, 0.2])
+            if uniforms is None:
+                ax = rng.choice(ACCEL_CHOICES, p=ACCEL_PROBS)
+            else:
+                ax = accels[i, t]
 
             # Update velocity and position
-            v = max(0.0, v + ax * dt)
-            x += v * dt
+            v = max(0.0, v + ax * dts[t])
+            x += v * dts[t]
 
             traj.append([x, y, v])
 
@@ -37,12 +54,90 @@ def simulate_others_rollout(others_initial_state, dt=0.1, horizon=3.0, rng=None)
     return others_trajs
 
 
+def simulate_others_rollouts(others_initial_state, n_samples, dt=0.1,
+                             horizon=3.0, rng=None, uniforms=None,
+                             behavior="random", lane_width=3.5,
+                             dtype=np.float64, backend=None, timestamps=None):
+    """
+    Simulate n_samples futures for all other vehicles at once.
+
+    behavior:
+        'random' - same model as simulate_others_rollout (random accelerations)
+        'idm'    - Intelligent Driver Model car-following, with the random
+                   acceleration added on top as a stochastic perturbation.
+                   The ego is deliberately not a leader here (unlike
+                   HighwayEnv(behavior='idm')): one pool of futures is
+                   shared by every candidate, so traffic cannot react to a
+                   particular ego plan. A car behind the ego does not brake
+                   for it, which makes the estimate conservative for
+                   candidates that slow down in front of other traffic.
+    uniforms: optional (n_samples, N * T) array in [0, 1) driving the random
+              accelerations; drawn i.i.d. from rng if None
+    dtype: float dtype of the state and output (float32 halves memory)
+    backend: kernel backend for the 'random' model (see kernels.get_backend)
+    timestamps: optional (T,) state times for a non-uniform grid
+                (overrides dt and horizon)
+
+    Returns:
+        rollouts: (n_samples, N, T, 3) array of [x, y, v]
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    state = np.asarray(others_initial_state, dtype=dtype).reshape(-1, 3)
+    N = state.shape[0]
+    _, dts = resolve_time_grid(dt, horizon, timestamps)
+    dts = dts.astype(dtype)
+    T = len(dts)
+
+    if uniforms is None:
+        uniforms = rng.random((n_samples, N * T))
+    accels = uniforms_to_accels(
+        np.asarray(uniforms).reshape(n_samples, N, T)
+    ).astype(dtype)
+
+    if behavior == "random":
+        return get_backend(backend).integrate_rollouts(state, accels, dts)
+    if behavior != "idm":
+        raise ValueError(f"unknown behavior: {behavior!r}")
+
+    x = np.repeat(state[None, :, 0], n_samples, axis=0)
+    y = np.repeat(state[None, :, 1], n_samples, axis=0)
+    v = np.repeat(state[None, :, 2], n_samples, axis=0)
+    v_desired = state[:, 2]
+
+    rollouts = np.empty((n_samples, N, T, 3), dtype=dtype)
+    rollouts[:, :, :, 1] = y[:, :, None]
+
+    for t in range(T):
+        ax = accels[:, :, t] + idm_accelerations(
+            x, y, v, v_desired, lane_width=lane_width
+        ).astype(dtype)
+
+        v = np.maximum(0.0, v + ax * dts[t])
+        x = x + v * dts[t]
+
+        rollouts[:, :, t, 0] = x
+        rollouts[:, :, t, 2] = v
+
+    return rollouts
+
+
 def estimate_risk_for_trajectory(ego_traj, others_initial_state,
                                  n_samples=100, dt=0.1, horizon=3.0,
-                                 rng=None):
+                                 rng=None, sampling="iid", behavior="random",
+                                 broad_phase=False, timestamps=None):
     """
     Estimate collision risk for a single ego trajectory using Monte Carlo simulation.
 
+    sampling: 'iid', 'stratified' (Latin hypercube) or 'qmc' (scrambled Halton)
+              over the per-vehicle, per-step acceleration choices. All modes
+              give unbiased estimates; the last two have lower variance.
+    behavior: 'random' or 'idm' traffic model (see simulate_others_rollouts)
+    broad_phase: use the sweep-and-prune collision check (for dense traffic)
+    timestamps: optional (T,) state times for a non-uniform grid; must be the
+                grid ego_traj was generated on (overrides dt and horizon)
+
     Returns:
         risk_info: dict with keys:
             'collision_prob': float
@@ -55,16 +150,37 @@ def estimate_risk_for_trajectory(ego_traj, others_initial_state,
     collisions = 0
     min_dists = []
 
+    _, dts = resolve_time_grid(dt, horizon, timestamps)
+    T = len(dts)
+    U = None
+    if sampling != "iid" or behavior != "random":
+        U = sample_uniforms(n_samples, len(others_initial_state) * T,
+                            mode=sampling, rng=rng)
+
+    rollouts = None
+    if behavior != "random":
+        rollouts = simulate_others_rollouts(
+            others_initial_state, n_samples, dt=dt, horizon=horizon,
+            rng=rng, uniforms=U, behavior=behavior, timestamps=timestamps
+        )
+
     for k in range(n_samples):
         # Sample one future for all other vehicles
-        others_trajs = simulate_others_rollout(
-            others_initial_state,
-            dt=dt,
-            horizon=horizon,
-            rng=rng
-        )
+        if rollouts is not None:
+            others_trajs = rollouts[k]
+        else:
+            others_trajs = simulate_others_rollout(
+                others_initial_state,
+                dt=dt,
+                horizon=horizon,
+                rng=rng,
+                uniforms=None if U is None else U[k],
+                timestamps=timestamps
+            )
 
-        collided, t_coll, min_dist = check_collision(ego_traj, others_trajs)
+        collided, t_coll, min_dist = check_collision(ego_traj, others_trajs,
+                                                     broad_phase=broad_phase,
+                                                     timestamps=timestamps)
         if collided:
             collisions += 1
 
@@ -81,9 +197,115 @@ def estimate_risk_for_trajectory(ego_traj, others_initial_state,
     }
 
 
+# Working bytes per (sample, vehicle, step) beyond the rollout itself:
+# uniforms + accelerations (float64) and the collision temporaries
+# (dx, dy, dist, masked copy in the rollout dtype, two bool masks)
+STREAM_OVERHEAD_BYTES = 16
+STREAM_TEMP_ARRAYS = 4
+
+
+def streaming_chunk_size(n_others, T, dtype=np.float64, max_bytes=64 * 2**20):
+    """Number of samples per chunk so one chunk's working set fits max_bytes."""
+    itemsize = np.dtype(dtype).itemsize
+    per_sample = max(n_others, 1) * T * (
+        (3 + STREAM_TEMP_ARRAYS) * itemsize + STREAM_OVERHEAD_BYTES + 2
+    )
+    return max(1, int(max_bytes // per_sample))
+
+
+def estimate_risk_streaming(ego_traj, others_initial_state,
+                            n_samples=100, dt=0.1, horizon=3.0,
+                            rng=None, sampling="iid", behavior="random",
+                            dtype=np.float64, max_bytes=64 * 2**20,
+                            backend=None, timestamps=None):
+    """
+    Memory-bounded version of estimate_risk_for_trajectory.
+
+    Samples are simulated and collision-checked in chunks sized by
+    streaming_chunk_size, and each chunk is folded into running
+    statistics (collision count, sum and min of the minimum distances),
+    so peak memory is set by max_bytes rather than by n_samples.
+
+    Tolerance against the unchunked path (max_bytes=None, same rng seed):
+        - float64, 'iid' sampling: identical collision_prob and
+          worst_min_distance; avg_min_distance equal up to summation order
+          (relative difference below 1e-12)
+        - float32: positions carry ~1e-6 relative rounding, so distances
+          agree within about 1e-3 m over a few seconds of highway driving,
+          and collision flags can only differ for boxes within that margin
+          of touching
+    'stratified' and 'qmc' samples are randomized independently per chunk,
+    which keeps the estimate unbiased but differs from one global set.
+
+    backend: kernel backend for rollout integration and collision search
+             (see kernels.get_backend); all backends agree in float64.
+    timestamps: optional (T,) state times for a non-uniform grid; coarse
+                steps are interpolated to COLLISION_MAX_DT for the
+                collision search, as in check_collision
+
+    Returns:
+        risk_info: dict with the same keys as estimate_risk_for_trajectory
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    N = len(others_initial_state)
+    ts, dts = resolve_time_grid(dt, horizon, timestamps)
+    T = len(dts)
+
+    T_check = T
+    if timestamps is not None:
+        ego_traj, dense_times, _ = densify(ego_traj[:T], ts, COLLISION_MAX_DT)
+        T_check = len(dense_times)
+
+    if max_bytes is None:
+        chunk = n_samples
+    else:
+        chunk = streaming_chunk_size(N, T + T_check, dtype, max_bytes)
+
+    backend = get_backend(backend)
+
+    collisions = 0
+    dist_sum = 0.0
+    worst = float("inf")
+
+    for start in range(0, n_samples, chunk):
+        size = min(chunk, n_samples - start)
+        U = sample_uniforms(size, N * T, mode=sampling, rng=rng)
+        rollouts = simulate_others_rollouts(
+            others_initial_state, size, dt=dt, horizon=horizon,
+            rng=rng, uniforms=U, behavior=behavior, dtype=dtype,
+            backend=backend, timestamps=timestamps
+        )
+        del U
+        if timestamps is not None:
+            rollouts = densify(rollouts, ts, COLLISION_MAX_DT)[0]
+
+        collided, _, min_dists = backend.first_collision(ego_traj, rollouts)
+        del rollouts
+
+        collisions += int(collided.sum())
+        dist_sum += float(min_dists.sum())
+        worst = min(worst, float(min_dists.min()))
+
+    if n_samples == 0:
+        return {
+            "collision_prob": 0.0,
+            "avg_min_distance": float("inf"),
+            "worst_min_distance": float("inf"),
+        }
+
+    return {
+        "collision_prob": collisions / n_samples,
+        "avg_min_distance": dist_sum / n_samples,
+        "worst_min_distance": worst,
+    }
+
+
 def estimate_risk_for_all(ego_trajs, others_initial_state,
                           n_samples=100, dt=0.1, horizon=3.0,
-                          rng=None):
+                          rng=None, sampling="iid", behavior="random",
+                          broad_phase=False, timestamps=None):
     """
     Compute risk estimates for a list of ego trajectories.
     Returns:
@@ -100,7 +322,47 @@ def estimate_risk_for_all(ego_trajs, others_initial_state,
             n_samples=n_samples,
             dt=dt,
             horizon=horizon,
-            rng=rng
+            rng=rng,
+            sampling=sampling,
+            behavior=behavior,
+            broad_phase=broad_phase,
+            timestamps=timestamps
         )
         risks.append(info)
     return risks
+
+
+def compare_sampling_modes(ego_traj, others_initial_state,
+                           sample_counts=(25, 50, 100), n_repeats=20,
+                           modes=("iid", "stratified", "qmc"),
+                           dt=0.1, horizon=3.0, rng=None):
+    """
+    Empirical variance of the collision probability estimate for each
+    sampling mode and sample count, over n_repeats independent runs.
+
+    Returns:
+        results: dict mode -> list of dicts with keys
+            'n_samples', 'mean', 'variance'
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    results = {}
+    for mode in modes:
+        rows = []
+        for n in sample_counts:
+            estimates = [
+                estimate_risk_for_trajectory(
+                    ego_traj, others_initial_state,
+                    n_samples=n, dt=dt, horizon=horizon,
+                    rng=rng, sampling=mode
+                )["collision_prob"]
+                for _ in range(n_repeats)
+            ]
+            rows.append({
+                "n_samples": n,
+                "mean": float(np.mean(estimates)),
+                "variance": float(np.var(estimates, ddof=1)),
+            })
+        results[mode] = rows
+    return results
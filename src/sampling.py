@@ -0,0 +1,85 @@
+import numpy as np
+
+# Discrete acceleration model for other vehicles (m/s^2)
+ACCEL_CHOICES = np.array([-2.0, 0.0, 1.0])
+ACCEL_PROBS = np.array([0.2, 0.6, 0.2])
+
+SAMPLING_MODES = ("iid", "stratified", "qmc")
+
+
+def sample_uniforms(n_samples, n_dims, mode="iid", rng=None):
+    """
+    Draw an (n_samples, n_dims) array of points in [0, 1).
+
+    mode:
+        'iid'        - independent uniforms
+        'stratified' - Latin hypercube: each dimension has exactly one point
+                       per stratum [k/n, (k+1)/n)
+        'qmc'        - scrambled Halton sequence with a random shift (mod 1)
+
+    Every row is marginally uniform on [0, 1)^n_dims in all modes, so any
+    Monte Carlo average built from the rows stays unbiased.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    if mode == "iid":
+        return rng.random((n_samples, n_dims))
+    if mode == "stratified":
+        return latin_hypercube(n_samples, n_dims, rng)
+    if mode == "qmc":
+        return scrambled_halton(n_samples, n_dims, rng)
+    raise ValueError(f"unknown sampling mode: {mode!r} (expected one of {SAMPLING_MODES})")
+
+
+def latin_hypercube(n_samples, n_dims, rng):
+    """Latin hypercube sample: one jittered point per stratum per dimension."""
+    strata = rng.permuted(
+        np.tile(np.arange(n_samples), (n_dims, 1)), axis=1
+    ).T
+    return (strata + rng.random((n_samples, n_dims))) / n_samples
+
+
+def first_primes(n):
+    """Return the first n prime numbers."""
+    # Upper bound on the n-th prime (Rosser's theorem) for n >= 6
+    limit = 15 if n < 6 else int(n * (np.log(n) + np.log(np.log(n)))) + 1
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, int(limit ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    return np.flatnonzero(sieve)[:n]
+
+
+def scrambled_halton(n_samples, n_dims, rng):
+    """
+    Halton points with random digit permutations per dimension and digit
+    position, followed by a uniform random shift modulo 1
+    (Cranley-Patterson rotation). The shift makes each point exactly
+    uniform, the scrambling breaks the correlation between high dimensions.
+    """
+    idx = np.arange(n_samples)
+    out = np.empty((n_samples, n_dims))
+
+    for j, base in enumerate(first_primes(n_dims)):
+        n_digits = max(1, int(np.ceil(np.log(n_samples + 1) / np.log(base))))
+        rem = idx.copy()
+        u = np.zeros(n_samples)
+        scale = 1.0 / base
+        for _ in range(n_digits):
+            perm = rng.permutation(base)
+            u += perm[rem % base] * scale
+            rem //= base
+            scale /= base
+        out[:, j] = u
+
+    out += rng.random(n_dims)
+    return np.mod(out, 1.0)
+
+
+def uniforms_to_accels(u, choices=ACCEL_CHOICES, probs=ACCEL_PROBS):
+    """Map uniforms in [0, 1) to accelerations via the inverse categorical CDF."""
+    cdf = np.cumsum(probs)
+    cdf[-1] = 1.0
+    return np.asarray(choices)[np.searchsorted(cdf, u, side="right")]
@@ -0,0 +1,239 @@
+import glob
+import json
+import os
+
+import numpy as np
+
+from collision import EGO_WIDTH, EGO_LENGTH, OTHER_WIDTH, OTHER_LENGTH
+from logger import LOG_DIR
+from risk import estimate_risk_for_trajectory
+from timegrid import resolve_time_grid
+from trajectories import generate_trajectories
+
+FEATURE_NAMES = [
+    "min_distance",       # closest approach under constant-velocity traffic
+    "min_lane_gap",       # smallest bumper gap to a car overlapping in y
+    "closing_speed",      # ego speed - other speed at closest approach
+    "lateral_offset",     # y_end - y_start of the candidate
+    "speed_change",       # v_end - v_start of the candidate
+    "n_close",            # cars ever within 10 m of the ego
+]
+
+
+def scene_features(ego_trajs, others_initial_state, dt=0.1, horizon=3.0,
+                   timestamps=None):
+    """
+    Hand-built features for each candidate, using a deterministic
+    constant-velocity prediction of the other vehicles.
+
+    Returns:
+        X: (K, len(FEATURE_NAMES)) array
+    """
+    ts, _ = resolve_time_grid(dt, horizon, timestamps)
+    others = np.asarray(others_initial_state, dtype=float).reshape(-1, 3)
+    ox = others[:, 0, None] + others[:, 2, None] * ts[None, :]   # (N, T)
+    oy = np.repeat(others[:, 1, None], len(ts), axis=1)
+    ov = others[:, 2]
+
+    rows = []
+    for traj in ego_trajs:
+        T = min(len(ts), traj.shape[0])
+        dx = traj[None, :T, 0] - ox[:, :T]
+        dy = traj[None, :T, 1] - oy[:, :T]
+        dist = np.sqrt(dx**2 + dy**2)
+
+        if dist.size:
+            n, t = np.unravel_index(np.argmin(dist), dist.shape)
+            min_distance = dist[n, t]
+            closing = traj[t, 2] - ov[n]
+            in_lane = np.abs(dy) < (EGO_WIDTH + OTHER_WIDTH) / 2
+            gaps = np.where(in_lane, np.abs(dx) - (EGO_LENGTH + OTHER_LENGTH) / 2,
+                            np.inf)
+            min_gap = min(gaps.min(), 100.0)
+            n_close = np.sum((dist < 10.0).any(axis=1))
+        else:
+            min_distance, closing, min_gap, n_close = 100.0, 0.0, 100.0, 0
+
+        rows.append([
+            min(min_distance, 100.0),
+            min_gap,
+            closing,
+            traj[T - 1, 1] - traj[0, 1],
+            traj[T - 1, 2] - traj[0, 2],
+            n_close,
+        ])
+    return np.array(rows, dtype=float)
+
+
+def load_training_data(log_dir=LOG_DIR, dt=0.1, horizon=3.0):
+    """
+    Build (X, y) from the detail_*.jsonl logs: the candidates are
+    regenerated from the logged ego state, and the label is the logged
+    Monte Carlo collision_prob of each candidate.
+
+    Each record's own 'dt', 'horizon' and 'timestamps' are used when logged
+    (dt and horizon are the defaults for older records). Risks marked
+    'surrogate' are skipped: their collision_prob is a model prediction,
+    not a Monte Carlo label.
+    """
+    X, y = [], []
+    for path in sorted(glob.glob(os.path.join(log_dir, "detail_*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                rec_dt = rec.get("dt", dt)
+                rec_horizon = rec.get("horizon", horizon)
+                timestamps = rec.get("timestamps")
+                ego_trajs = generate_trajectories(
+                    np.array(rec["ego_state"]), dt=rec_dt,
+                    horizon=rec_horizon, timestamps=timestamps
+                )
+                pairs = [(traj, r) for traj, r in zip(ego_trajs, rec["risks"])
+                         if not r.get("surrogate")]
+                if not pairs:
+                    continue
+                feats = scene_features([traj for traj, _ in pairs],
+                                       rec["others_state"], rec_dt,
+                                       rec_horizon, timestamps)
+                X.append(feats)
+                y.extend(r["collision_prob"] for _, r in pairs)
+    if not X:
+        return np.empty((0, len(FEATURE_NAMES))), np.empty(0)
+    return np.vstack(X), np.array(y, dtype=float)
+
+
+class SurrogateRiskModel:
+    """
+    Cheap collision_prob predictor fitted on logged Monte Carlo results.
+
+    kind='knn':   mean label of the k nearest standardized feature vectors;
+                  uncertainty is the spread of those labels
+    kind='ridge': ridge regression on the features; uncertainty is the
+                  training residual standard deviation
+    Predictions are clipped to [0, 1].
+    """
+
+    def __init__(self, kind="knn", k=10, alpha=1.0):
+        if kind not in ("knn", "ridge"):
+            raise ValueError(f"unknown surrogate kind: {kind!r}")
+        self.kind = kind
+        self.k = k
+        self.alpha = alpha
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.mean = X.mean(axis=0)
+        self.scale = X.std(axis=0)
+        self.scale[self.scale == 0] = 1.0
+        Z = (X - self.mean) / self.scale
+
+        if self.kind == "knn":
+            self.Z, self.y = Z, y
+        else:
+            A = np.column_stack([Z, np.ones(len(Z))])
+            reg = self.alpha * np.eye(A.shape[1])
+            reg[-1, -1] = 0.0  # do not shrink the intercept
+            self.coef = np.linalg.solve(A.T @ A + reg, A.T @ y)
+            self.resid_std = float(np.std(y - A @ self.coef))
+        return self
+
+    def predict(self, X):
+        """
+        Returns:
+            p: (M,) predicted collision probabilities
+            uncertainty: (M,) spread of the prediction
+        """
+        Z = (np.atleast_2d(np.asarray(X, dtype=float)) - self.mean) / self.scale
+
+        if self.kind == "knn":
+            k = min(self.k, len(self.y))
+            d2 = ((Z[:, None, :] - self.Z[None, :, :]) ** 2).sum(axis=2)
+            nn = np.argpartition(d2, k - 1, axis=1)[:, :k]
+            labels = self.y[nn]
+            p, unc = labels.mean(axis=1), labels.std(axis=1)
+        else:
+            p = np.column_stack([Z, np.ones(len(Z))]) @ self.coef
+            unc = np.full(len(Z), self.resid_std)
+
+        return np.clip(p, 0.0, 1.0), unc
+
+
+def calibration_error(p_pred, p_true, n_bins=10):
+    """
+    Expected calibration error: bin predictions, then average
+    |mean prediction - mean Monte Carlo label| weighted by bin size.
+    """
+    p_pred = np.asarray(p_pred, dtype=float)
+    p_true = np.asarray(p_true, dtype=float)
+    bins = np.minimum((p_pred * n_bins).astype(int), n_bins - 1)
+    ece = 0.0
+    for b in np.unique(bins):
+        sel = bins == b
+        ece += sel.mean() * abs(p_pred[sel].mean() - p_true[sel].mean())
+    return float(ece)
+
+
+def prescreen(model, ego_trajs, others_initial_state, top_k=2,
+              max_uncertainty=0.15, dt=0.1, horizon=3.0, timestamps=None):
+    """
+    Rank candidates with the surrogate and pick those that need full
+    Monte Carlo: the top_k with the lowest predicted risk, plus any
+    candidate whose prediction is too uncertain.
+
+    Returns:
+        selected: sorted list of candidate indices for Monte Carlo
+        p: (K,) predicted collision probabilities
+        features: (K, F) feature matrix
+    """
+    features = scene_features(ego_trajs, others_initial_state, dt, horizon,
+                              timestamps)
+    p, unc = model.predict(features)
+    selected = set(np.argsort(p, kind="stable")[:top_k].tolist())
+    selected |= set(np.flatnonzero(unc > max_uncertainty).tolist())
+    return sorted(selected), p, features
+
+
+def estimate_risk_with_prescreen(model, ego_trajs, others_initial_state,
+                                 top_k=2, max_uncertainty=0.15,
+                                 n_samples=100, dt=0.1, horizon=3.0,
+                                 rng=None, **risk_kwargs):
+    """
+    Drop-in alternative to estimate_risk_for_all: only the candidates chosen
+    by prescreen go through Monte Carlo. The others get the surrogate
+    collision_prob, and the constant-velocity closest approach as distance.
+    Their dicts carry 'surrogate': True.
+
+    Returns:
+        risks: list of risk_info dicts (one per trajectory)
+        fallback_rate: fraction of candidates sent to Monte Carlo
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    selected, p, features = prescreen(
+        model, ego_trajs, others_initial_state, top_k=top_k,
+        max_uncertainty=max_uncertainty, dt=dt, horizon=horizon,
+        timestamps=risk_kwargs.get("timestamps")
+    )
+
+    risks = []
+    for i, ego_traj in enumerate(ego_trajs):
+        if i in selected:
+            info = estimate_risk_for_trajectory(
+                ego_traj, others_initial_state, n_samples=n_samples,
+                dt=dt, horizon=horizon, rng=rng, **risk_kwargs
+            )
+        else:
+            d = float(features[i, FEATURE_NAMES.index("min_distance")])
+            info = {
+                "collision_prob": float(p[i]),
+                "avg_min_distance": d,
+                "worst_min_distance": d,
+                "surrogate": True,
+            }
+        risks.append(info)
+
+    return risks, len(selected) / max(len(ego_trajs), 1)
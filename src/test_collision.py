@@ -27,3 +27,50 @@ for i, ego_traj in enumerate(ego_trajs):
     print("  Collided:", collided)
     print("  Collision timestep:", t)
     print("  Minimum distance:", round(min_dist, 2))
+
+# Broad phase (sweep-and-prune) must agree with the exhaustive check
+for i, ego_traj in enumerate(ego_trajs):
+    exhaustive = check_collision(ego_traj, others_trajs)
+    swept = check_collision(ego_traj, others_trajs, broad_phase=True)
+    print(f"Trajectory {i+1} broad phase:", swept[0], swept[1], round(swept[2], 2))
+    assert exhaustive[:2] == swept[:2]
+    assert abs(exhaustive[2] - swept[2]) < 1e-9
+
+# Known collisions: two parked cars (0 and 2) first overlap the keep-lane
+# ego at the same step; vehicle 3 is closer at that step but listed after
+# them, so min_distance must stop at the first colliding vehicle
+def constant_speed(state, T=30, dt=0.1):
+    steps = dt * np.arange(1, T + 1)
+    return [np.column_stack([x + v * steps, np.full(T, y), np.full(T, v)])
+            for x, y, v in state]
+
+ego_trajs = generate_trajectories(np.array([0.0, 3.5, 20.0]))
+others_trajs = constant_speed([[38.0, 3.5, 0.0], [80.0, 0.0, 20.0],
+                               [38.0, 5.0, 0.0], [10.0, 7.0, 15.0]])
+keep = ego_trajs[0]
+exhaustive = check_collision(keep, others_trajs)
+swept = check_collision(keep, others_trajs, broad_phase=True)
+t = exhaustive[1]
+overlapping = [i for i, o in enumerate(others_trajs)
+               if abs(keep[t, 0] - o[t, 0]) < 4.5 and abs(keep[t, 1] - o[t, 1]) < 2.0]
+nearest = min(np.hypot(*(keep[t, :2] - o[t, :2])) for o in others_trajs)
+assert exhaustive[0] and overlapping == [0, 2] and nearest < exhaustive[2]
+assert exhaustive[:2] == swept[:2] and abs(exhaustive[2] - swept[2]) < 1e-9
+print("Double overlap at step", t, "min distance:", round(swept[2], 2))
+
+# Seeded dense scenes with many collisions
+rng = np.random.default_rng(7)
+n_collisions = 0
+for _ in range(40):
+    state = np.column_stack([rng.uniform(-20, 80, 40),
+                             rng.integers(0, 3, 40) * 3.5,
+                             rng.uniform(0, 25, 40)])
+    others_trajs = constant_speed(state)
+    for ego_traj in generate_trajectories(np.array([0.0, 3.5, rng.uniform(15, 30)])):
+        exhaustive = check_collision(ego_traj, others_trajs)
+        swept = check_collision(ego_traj, others_trajs, broad_phase=True)
+        assert exhaustive[:2] == swept[:2]
+        assert abs(exhaustive[2] - swept[2]) < 1e-9
+        n_collisions += exhaustive[0]
+print("Broad phase parity on seeded scenes:", n_collisions, "collisions")
+assert n_collisions > 50
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import numpy as np
+from dataset import build_dataset, build_shard, load_shard, load_manifest
+
+print(">>> Running dataset builder test")
+
+with tempfile.TemporaryDirectory() as out_dir:
+    params = {"n_samples": 20}
+
+    # 1. Fresh build
+    stats = build_dataset(out_dir, n_shards=3, scenes_per_shard=4,
+                          params=params, workers=1)
+    assert stats["built"] == 3 and stats["skipped"] == 0
+
+    shard = load_shard(out_dir, 1)
+    print("Shard 1 arrays:", {k: v.shape for k, v in shard.items()})
+    print("Chosen:", shard["chosen"])
+
+    # 2. Resume after an interrupted job rebuilds only the missing shard
+    os.remove(os.path.join(out_dir, "shard_00001.npz"))
+    stats = build_dataset(out_dir, n_shards=3, scenes_per_shard=4,
+                          params=params, workers=1)
+    assert stats["built"] == 1 and stats["skipped"] == 2
+    assert len(load_manifest(out_dir)["shards"]) == 3
+
+    # 3. Shards are deterministic given (base_seed, shard_id)
+    rebuilt = load_shard(out_dir, 1)
+    assert all(np.array_equal(shard[k], rebuilt[k]) for k in shard)
+
+    with tempfile.TemporaryDirectory() as other_dir:
+        build_shard(other_dir, 1, 4, base_seed=0,
+                    params=load_manifest(out_dir)["config"]["params"])
+        again = load_shard(other_dir, 1)
+        assert all(np.array_equal(shard[k], again[k]) for k in shard)
+
+print("✓ Dataset shards are deterministic and resumable")
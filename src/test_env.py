@@ -9,3 +9,45 @@ print(state)
 for i in range(5):
     ego_state, others_state = env.step(ego_ax=0.0)
     print(f"Step {i+1} ego:", ego_state)
+
+# Vectorized environment: batched stepping with per-instance seeds
+import time
+import numpy as np
+from env import HighwayEnv, VecHighwayEnv
+
+vec = VecHighwayEnv(n_envs=8, seed=42, max_steps=10**6)
+single = HighwayEnv()
+single.reset(seed=vec.seeds[3])
+for i in range(20):
+    ego_state, others_state = single.step(ego_ax=0.0)
+    ego_states, others_states, terminated, truncated, info = vec.step(ego_ax=0.0)
+    assert np.allclose(info["final_ego"][3], ego_state)
+    if terminated[3] or truncated[3]:
+        break
+    assert np.allclose(ego_states[3], ego_state)
+    assert np.allclose(others_states[3], others_state)
+print("Vec env instance 3 matches HighwayEnv:", ego_states[3])
+
+# Same seed -> same episodes; finished instances auto-reset
+a = VecHighwayEnv(n_envs=64, seed=1, max_steps=50)
+b = VecHighwayEnv(n_envs=64, seed=1, max_steps=50)
+n_done = n_crash = 0
+for _ in range(120):
+    ea, oa, term_a, trunc_a, info_a = a.step(ego_ax=1.0)
+    eb, ob, term_b, trunc_b, _ = b.step(ego_ax=1.0)
+    assert np.array_equal(oa, ob) and np.array_equal(term_a, term_b)
+    assert np.array_equal(trunc_a, trunc_b) and not (term_a & trunc_a).any()
+    done = term_a | trunc_a
+    # Terminal observations survive the auto-reset
+    assert np.array_equal(info_a["final_ego"][~done], ea[~done])
+    assert (info_a["final_ego"][done, 0] > 0.0).all() and (ea[done, 0] == 0.0).all()
+    n_done += int(done.sum())
+    n_crash += int(term_a.sum())
+print("Episodes finished and auto-reset:", n_done, "of which crashes:", n_crash)
+assert n_done >= 64 and a.steps.max() < 50 and 0 < n_crash < n_done
+
+vec = VecHighwayEnv(n_envs=1024, seed=0)
+t0 = time.perf_counter()
+for _ in range(100):
+    vec.step(ego_ax=0.0)
+print(f"Vec env throughput: {1024 * 100 / (time.perf_counter() - t0):,.0f} steps/s")
@@ -0,0 +1,41 @@
+import numpy as np
+from kernels import BACKENDS, get_backend, benchmark_backends
+from risk import estimate_risk_streaming
+from trajectories import generate_trajectories
+
+print(">>> Running kernel backend parity test")
+print("Available backends:", sorted(BACKENDS))
+print("Selected by default:", get_backend())
+
+# Same seeded scene for every backend
+rng = np.random.default_rng(3)
+N, S, T = 20, 300, 30
+state = np.column_stack([
+    rng.uniform(0, 80, N),
+    rng.integers(0, 3, N) * 3.5,
+    rng.uniform(15, 25, N),
+])
+accels = rng.choice([-2.0, 0.0, 1.0], p=[0.2, 0.6, 0.2], size=(S, N, T))
+ego_trajs = generate_trajectories(np.array([0.0, 3.5, 20.0]))
+
+reference = BACKENDS["numpy"]
+ref_rollouts = reference.integrate_rollouts(state, accels, 0.1)
+
+for name, backend in BACKENDS.items():
+    rollouts = backend.integrate_rollouts(state, accels, 0.1)
+    assert np.allclose(rollouts, ref_rollouts, rtol=1e-12, atol=1e-9)
+
+    for ego_traj in ego_trajs:
+        c_ref, t_ref, d_ref = reference.first_collision(ego_traj, ref_rollouts)
+        c, t, d = backend.first_collision(ego_traj, rollouts)
+        assert (c == c_ref).all() and (t == t_ref).all()
+        assert np.allclose(d, d_ref, rtol=1e-12)
+
+    risk = estimate_risk_streaming(ego_trajs[0], state, n_samples=200,
+                                   rng=np.random.default_rng(11),
+                                   backend=name)
+    print(f"{name:>6}: {risk}")
+
+# Speedup per backend (small problem so the test stays quick)
+for name, r in benchmark_backends(n_samples=200, n_others=20, repeats=1).items():
+    print(f"{name:>6}: speedup={r['speedup']:.1f}x")
@@ -0,0 +1,66 @@
+import csv
+import math
+import os
+import tempfile
+import time
+import matplotlib
+matplotlib.use("Agg")  # headless: blitting works on the Agg canvas
+import logger
+from live_dashboard import LiveDashboard, SummaryTailer, MANEUVERS
+
+print(">>> Running live dashboard test")
+
+saved_log_dir = logger.LOG_DIR
+with tempfile.TemporaryDirectory() as tmp:
+    logger.LOG_DIR = tmp
+    tailer = SummaryTailer(os.path.join(tmp, logger.SUMMARY_FILENAME))
+    dash = LiveDashboard(window=50, refresh_s=0.0)
+
+    n_runs = 120
+    t0 = time.perf_counter()
+    for k in range(n_runs):
+        for i, m in enumerate(MANEUVERS):
+            logger.append_summary_row({
+                "run_id": f"run_{k}",
+                "traj_id": i,
+                "traj_type": m,
+                "collision_prob": 0.01 * (k % 10),
+                "chosen": 1 if i == k % len(MANEUVERS) else 0,
+                "latency_ms": 40.0 + k % 7,
+            })
+        events = tailer.poll()
+        assert len(events) == 1
+        dash.update(events)
+    fps = n_runs / (time.perf_counter() - t0)
+
+    # Rolling windows stay bounded
+    assert len(dash.latency) == 50 and dash.cycle == n_runs
+    assert tailer.poll() == []
+
+# Tailing a log that started with an older header (no latency_ms)
+with tempfile.TemporaryDirectory() as tmp:
+    logger.LOG_DIR = tmp
+    path = os.path.join(tmp, logger.SUMMARY_FILENAME)
+    old_header = logger.SUMMARY_HEADER[:logger.SUMMARY_HEADER.index("comfort_cost")]
+    old_row = {"run_id": "run_old", "traj_id": 0, "traj_type": "keep",
+               "chosen": 1}
+    wide_row = dict(old_row, run_id="run_wide", latency_ms=12.0)
+    with open(path, mode="w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(old_header)
+        writer.writerow([old_row.get(k, "") for k in old_header])
+        writer.writerow([wide_row.get(k, "") for k in logger.SUMMARY_HEADER])
+
+    tailer = SummaryTailer(path)
+    events = tailer.poll()
+    assert [e["run_id"] for e in events] == ["run_old", "run_wide"]
+    assert math.isnan(events[0]["latency_ms"]) and events[1]["latency_ms"] == 12.0
+
+    # The next append migrates (replaces) the file; only the new row is emitted
+    logger.append_summary_row(dict(old_row, run_id="run_new", latency_ms=30.0))
+    events = tailer.poll()
+    assert [e["run_id"] for e in events] == ["run_new"]
+    assert events[0]["latency_ms"] == 30.0
+    assert tailer.header == logger.SUMMARY_HEADER
+    logger.LOG_DIR = saved_log_dir
+    print(f"Window size: {len(dash.latency)}, refresh rate: {fps:.0f} updates/s")
@@ -0,0 +1,56 @@
+import csv
+import os
+import tempfile
+import numpy as np
+import logger
+
+print(">>> Running logger schema migration test")
+
+# Header of summary.csv files written before the comfort_cost column
+OLD_HEADER = logger.SUMMARY_HEADER[:logger.SUMMARY_HEADER.index("comfort_cost")]
+
+
+def row(run_id, traj_id, comfort_cost):
+    return {
+        "run_id": run_id, "traj_id": traj_id, "traj_type": "keep",
+        "collision_prob": 0.1, "avg_min_distance": 12.0,
+        "worst_min_distance": 8.0, "score": 0.2, "chosen": 1,
+        "comfort_cost": comfort_cost,
+    }
+
+
+saved_log_dir = logger.LOG_DIR
+with tempfile.TemporaryDirectory() as tmp:
+    logger.LOG_DIR = tmp
+    path = os.path.join(tmp, logger.SUMMARY_FILENAME)
+
+    # 1. Old-format file: an old row, plus a wider row appended under the
+    #    old header (as the logger did before migrating)
+    with open(path, mode="w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(OLD_HEADER)
+        writer.writerow([row("run_old", 0, "").get(k, "") for k in OLD_HEADER])
+        writer.writerow([row("run_wide", 0, 3.5).get(k, "")
+                         for k in logger.SUMMARY_HEADER])
+
+    runs = logger.load_summary_runs(path)
+    assert np.isnan(runs["run_old"]["comfort_cost"][0])
+    assert runs["run_wide"]["comfort_cost"][0] == 3.5
+
+    # 2. Appending migrates the header and keeps every existing value
+    logger.append_summary_row(row("run_new", 0, 1.25))
+    with open(path, newline="") as f:
+        lines = list(csv.reader(f))
+    assert lines[0] == logger.SUMMARY_HEADER
+    assert all(len(line) == len(logger.SUMMARY_HEADER) for line in lines)
+
+    runs = logger.load_summary_runs(path)
+    assert np.isnan(runs["run_old"]["comfort_cost"][0])
+    assert runs["run_wide"]["comfort_cost"][0] == 3.5
+    assert runs["run_new"]["comfort_cost"][0] == 1.25
+    assert runs["run_old"]["collision_prob"][0] == 0.1
+
+    # 3. An up-to-date file is left untouched
+    assert not logger.migrate_summary(path)
+    logger.LOG_DIR = saved_log_dir
+    print(f"Migrated {len(lines) - 1} rows to {len(logger.SUMMARY_HEADER)} columns")
@@ -0,0 +1,53 @@
+import numpy as np
+from multi_ego import plan_multi_ego, ego_conflict
+from risk import estimate_risk_streaming
+from timegrid import multires_time_grid
+
+print(">>> Running multi-ego joint planning test")
+
+names = ["keep", "brake", "lane_left", "lane_right"]
+
+# Ego A (center lane) has a slow car ahead and a car beside it on the left,
+# so on its own it moves right. Ego B (right lane, higher priority) keeps
+# its lane, which blocks that lane change.
+ego_a = np.array([0.0, 3.5, 20.0])
+ego_b = np.array([2.0, 0.0, 20.0])
+others_state = np.array([
+    [30.0, 3.5, 10.0],    # slow car ahead of ego A
+    [0.0, 7.0, 20.0],     # car beside ego A in the left lane
+    [12.0, -3.5, 15.0],   # car on ego B's right
+    [90.0, 0.0, 25.0],
+])
+
+alone = plan_multi_ego([ego_a], others_state, n_samples=100,
+                       rng=np.random.default_rng(0))
+print("Ego A alone:", names[alone["chosen"][0]])
+
+plan = plan_multi_ego([ego_b, ego_a], others_state, n_samples=100,
+                      rng=np.random.default_rng(0))
+for e, label in enumerate(["B", "A"]):
+    print(f"\nEgo {label}: chosen = {names[plan['chosen'][e]]}")
+    for i, (r, s) in enumerate(zip(plan["risks"][e], plan["scores"][e])):
+        print(f"  {names[i]:>10}: P={r['collision_prob']:.2f}, Score={s:.3f}")
+
+chosen = [plan["candidates"][e][k] for e, k in enumerate(plan["chosen"])]
+print("\nConflicts:", plan["conflicts"])
+
+# Both egos were scored against the same sampled futures
+assert plan["risks"][1] == alone["risks"][0]
+assert names[alone["chosen"][0]] == "lane_right"
+assert names[plan["chosen"][1]] != "lane_right"
+assert not plan["conflicts"] and not ego_conflict(chosen[0], chosen[1])
+
+# Non-uniform grid: every stage runs on the same timestamps
+ts = multires_time_grid()
+plan = plan_multi_ego([ego_b, ego_a], others_state, n_samples=100,
+                      rng=np.random.default_rng(0), timestamps=ts)
+assert all(traj.shape[0] == len(ts) for c in plan["candidates"] for traj in c)
+# Same draws as the streaming estimator for the first ego's candidates
+stream = estimate_risk_streaming(plan["candidates"][0][0], others_state,
+                                 n_samples=100, rng=np.random.default_rng(0),
+                                 timestamps=ts, max_bytes=None)
+assert stream == plan["risks"][0][0]
+print("Multi-resolution grid: chosen =",
+      [names[k] for k in plan["chosen"]], "conflicts:", plan["conflicts"])
@@ -1,9 +1,10 @@
 import numpy as np
 import random
+import time
 from env import HighwayEnv
 from trajectories import generate_trajectories
 from risk import estimate_risk_for_all
-from planner import select_best_trajectory, compute_score
+from planner import select_best_trajectory, compute_score, trajectory_comfort_cost
 from logger import make_run_id, append_summary_row, save_detail_json
 
 DT = 0.1
@@ -16,6 +17,7 @@ print(">>> Running planner test")
 # -----------------------------------
 # 1. Initialize environment
 # -----------------------------------
+t_start = time.perf_counter()
 env = HighwayEnv()
 ego_state, others_state = env.reset()
 print("Ego state:", ego_state)
@@ -62,7 +64,8 @@ for i, sc in enumerate(scores):
     print(f"Trajectory {i+1}: Score={sc:.4f}")
 
 best_idx, _ = select_best_trajectory(ego_trajs, risks)
-print(f"\n>>> Best trajectory selected = {best_idx+1}")
+latency_ms = (time.perf_counter() - t_start) * 1e3
+print(f"\n>>> Best trajectory selected = {best_idx+1} ({latency_ms:.0f} ms)")
 
 # -----------------------------------
 # 5. LOGGING SYSTEM
@@ -75,6 +78,8 @@ traj_types = ["keep", "brake", "lane_left", "lane_right"]
 detail = {
     "run_id": run_id,
     "seed": seed,
+    "dt": DT,
+    "horizon": HORIZON,
     "ego_state": ego_state.tolist(),
     "others_state": [list(o) for o in others_state],
     "risks": risks,
@@ -102,9 +107,37 @@ for i, r in enumerate(risks):
         "worst_min_distance": float(r["worst_min_distance"]),
         "score": float(scores[i]),
         "chosen": 1 if i == best_idx else 0,
-        "notes": ""
+        "notes": "",
+        "comfort_cost": trajectory_comfort_cost(ego_trajs[i]),
+        "latency_ms": latency_ms
     }
     append_summary_row(row)
 
 print(f"\n✓ Log saved to logs/summary.csv")
 print(f"✓ Detailed JSON saved to logs/detail_{run_id}.jsonl")
+
+# -----------------------------------
+# 6. Weight sweep over logged runs (no new Monte Carlo)
+# -----------------------------------
+from logger import load_summary_runs
+from planner import score_matrix, pareto_front
+
+run = load_summary_runs()[run_id]
+weight_grid = [
+    {'p': 1.0, 'd': 0.5, 'c': 0.1},
+    {'p': 5.0, 'd': 0.5, 'c': 0.1},
+    {'p': 1.0, 'd': 0.0, 'c': 1.0},
+]
+sweep_scores, sweep_best = score_matrix(
+    run["collision_prob"], run["avg_min_distance"], run["comfort_cost"],
+    weight_grid
+)
+assert np.allclose(sweep_scores[0], scores)
+assert sweep_best[0] == best_idx
+
+print("\n--- Weight sweep ---")
+for w, b in zip(weight_grid, sweep_best):
+    print(f"Weights {w}: best trajectory = {b+1}")
+front = pareto_front(run["collision_prob"], run["avg_min_distance"],
+                     run["comfort_cost"])
+print("Pareto front:", [int(i) + 1 for i in front])
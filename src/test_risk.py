@@ -35,3 +35,25 @@ for i, info in enumerate(risks):
     print(f"  Collision probability: {info['collision_prob']:.3f}")
     print(f"  Avg min distance: {info['avg_min_distance']:.2f} m")
     print(f"  Worst min distance: {info['worst_min_distance']:.2f} m")
+
+# 5. Streaming (chunked) estimator matches the unchunked path
+from risk import estimate_risk_streaming
+
+print("\n--- Streaming estimator ---")
+ego_traj = ego_trajs[0]
+full = estimate_risk_streaming(ego_traj, others_state, n_samples=N_SAMPLES,
+                               rng=np.random.default_rng(7), max_bytes=None)
+chunked = estimate_risk_streaming(ego_traj, others_state, n_samples=N_SAMPLES,
+                                  rng=np.random.default_rng(7),
+                                  max_bytes=64 * 1024)
+single = estimate_risk_streaming(ego_traj, others_state, n_samples=N_SAMPLES,
+                                 rng=np.random.default_rng(7),
+                                 max_bytes=64 * 1024, dtype=np.float32)
+print("Unchunked:", full)
+print("Chunked:  ", chunked)
+print("float32:  ", single)
+
+assert chunked["collision_prob"] == full["collision_prob"]
+assert chunked["worst_min_distance"] == full["worst_min_distance"]
+assert abs(chunked["avg_min_distance"] - full["avg_min_distance"]) < 1e-9
+assert abs(single["avg_min_distance"] - full["avg_min_distance"]) < 1e-3
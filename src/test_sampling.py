@@ -0,0 +1,42 @@
+import numpy as np
+from sampling import sample_uniforms, uniforms_to_accels, SAMPLING_MODES
+from trajectories import generate_trajectories
+from risk import compare_sampling_modes
+
+print(">>> Running sampling modes test")
+
+rng = np.random.default_rng(0)
+
+# 1. All modes produce points in [0, 1) with uniform marginals
+for mode in SAMPLING_MODES:
+    U = sample_uniforms(64, 90, mode=mode, rng=rng)
+    assert U.shape == (64, 90)
+    assert U.min() >= 0.0 and U.max() < 1.0
+    accels = uniforms_to_accels(U)
+    print(f"{mode:>10}: mean u={U.mean():.3f}, "
+          f"P(ax=0)={np.mean(accels == 0.0):.3f}")
+
+# 2. Latin hypercube puts exactly one point in each stratum per dimension
+U = sample_uniforms(50, 10, mode="stratified", rng=rng)
+assert all(len(set(np.floor(U[:, j] * 50).astype(int))) == 50 for j in range(10))
+
+# 3. Variance of the collision probability estimate per mode
+ego_traj = generate_trajectories(np.array([0.0, 3.5, 20.0]))[0]
+others_state = np.array([
+    [20.0, 3.5, 15.0],   # slower car ahead in ego lane
+    [40.0, 0.0, 20.0],
+    [30.0, 7.0, 18.0],
+])
+
+results = compare_sampling_modes(
+    ego_traj, others_state,
+    sample_counts=(20, 40), n_repeats=10, rng=rng
+)
+
+print("\n--- Estimator variance per sample count ---")
+for mode, rows in results.items():
+    for row in rows:
+        print(
+            f"{mode:>10} n={row['n_samples']:>3}: "
+            f"P={row['mean']:.3f}, Var={row['variance']:.5f}"
+        )
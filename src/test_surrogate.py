@@ -0,0 +1,95 @@
+import tempfile
+import numpy as np
+import logger
+from trajectories import generate_trajectories
+from risk import estimate_risk_streaming
+from planner import select_best_trajectory
+from surrogate import (SurrogateRiskModel, load_training_data, scene_features,
+                       calibration_error, estimate_risk_with_prescreen)
+
+print(">>> Running surrogate risk pre-screener test")
+
+N_SAMPLES = 50
+rng = np.random.default_rng(0)
+
+
+def planning_scene(seed):
+    """Dense scene: 6 cars close to the ego, some slower than it."""
+    scene_rng = np.random.default_rng(seed)
+    ego_state = np.array([0.0, 3.5, 20.0])
+    others_state = np.column_stack([
+        scene_rng.uniform(-10, 50, 6),
+        np.repeat([0.0, 3.5, 7.0], 2),
+        scene_rng.uniform(8, 25, 6),
+    ])
+    ego_trajs = generate_trajectories(ego_state)
+    risks = [estimate_risk_streaming(traj, others_state,
+                                     n_samples=N_SAMPLES, rng=rng)
+             for traj in ego_trajs]
+    return ego_state, others_state, ego_trajs, risks
+
+
+# 1. Log Monte Carlo results the way test_planner.py does
+saved_log_dir = logger.LOG_DIR
+with tempfile.TemporaryDirectory() as tmp:
+    logger.LOG_DIR = tmp
+    for seed in range(60):
+        ego_state, others_state, _, risks = planning_scene(seed)
+        logger.save_detail_json(f"run_{seed}", {
+            "dt": 0.1,
+            "horizon": 3.0,
+            "ego_state": ego_state.tolist(),
+            "others_state": others_state.tolist(),
+            "risks": risks,
+        })
+    X, y = load_training_data(tmp)
+
+    # Surrogate outputs are not labels; a record's own grid is used
+    surrogate_risk = {"collision_prob": 0.5, "avg_min_distance": 10.0,
+                      "worst_min_distance": 10.0, "surrogate": True}
+    logger.save_detail_json("run_screened", {
+        "dt": 0.2,
+        "horizon": 2.0,
+        "ego_state": ego_state.tolist(),
+        "others_state": others_state.tolist(),
+        "risks": [risks[0], surrogate_risk, surrogate_risk, risks[3]],
+    })
+    X_all, y_all = load_training_data(tmp)
+    logger.LOG_DIR = saved_log_dir
+
+print("Training set:", X.shape)
+assert X.shape == (240, 6)
+assert X_all.shape == (242, 6)
+short = generate_trajectories(ego_state, dt=0.2, horizon=2.0)
+assert np.allclose(X_all[-2:], scene_features([short[0], short[3]], others_state,
+                                              dt=0.2, horizon=2.0))
+assert list(y_all[-2:]) == [risks[0]["collision_prob"], risks[3]["collision_prob"]]
+
+# 2. Fit and check calibration on held-out scenes
+model = SurrogateRiskModel(kind="knn", k=8).fit(X, y)
+ridge = SurrogateRiskModel(kind="ridge").fit(X, y)
+
+X_test, y_test, fallback, agree = [], [], [], 0
+n_test = 20
+for seed in range(1000, 1000 + n_test):
+    _, others_state, ego_trajs, risks = planning_scene(seed)
+    X_test.append(scene_features(ego_trajs, others_state))
+    y_test.extend(r["collision_prob"] for r in risks)
+
+    screened, rate = estimate_risk_with_prescreen(
+        model, ego_trajs, others_state, top_k=2,
+        n_samples=N_SAMPLES, rng=rng
+    )
+    fallback.append(rate)
+    agree += (select_best_trajectory(ego_trajs, screened)[0]
+              == select_best_trajectory(ego_trajs, risks)[0])
+
+X_test = np.vstack(X_test)
+for name, m in [("knn", model), ("ridge", ridge)]:
+    p, _ = m.predict(X_test)
+    print(f"{name:>5}: calibration error={calibration_error(p, y_test):.3f}, "
+          f"MAE={np.mean(np.abs(p - y_test)):.3f}")
+print(f"Fallback rate: {np.mean(fallback):.2f} "
+      f"(Monte Carlo saved on {1 - np.mean(fallback):.0%} of candidates)")
+print(f"Same choice as full Monte Carlo: {agree}/{n_test}")
+assert 0.0 < np.mean(fallback) <= 1.0
@@ -0,0 +1,72 @@
+import numpy as np
+from timegrid import uniform_time_grid, multires_time_grid, step_sizes, densify
+from trajectories import generate_trajectories
+from risk import estimate_risk_for_all
+from collision import check_collision
+from planner import comfort_costs, select_best_trajectory, trajectory_comfort_cost
+
+print(">>> Running non-uniform time grid test")
+
+# 1. Multi-resolution grid: 7 s horizon at the 3 s / 0.1 s step count
+ts = multires_time_grid()
+print("Steps:", len(ts), "Horizon:", ts[-1], "s")
+print("Step sizes:", np.unique(np.round(step_sizes(ts), 6)))
+assert len(ts) == len(uniform_time_grid()) and abs(ts[-1] - 7.0) < 1e-9
+
+# 2. A uniform timestamps array reproduces the default dt path
+ego_state = np.array([0.0, 3.5, 20.0])
+default = generate_trajectories(ego_state)
+explicit = generate_trajectories(ego_state, timestamps=uniform_time_grid())
+assert all(np.allclose(a, b) for a, b in zip(default, explicit))
+
+# 3. Braking integrates on the coarse part of the grid too
+brake = generate_trajectories(ego_state, timestamps=ts)[1]
+print("Brake end speed:", brake[-1, 2])
+assert abs(brake[-1, 2] - (20.0 - 2.0 * 7.0)) < 1e-9
+
+# 4. Coarse steps are interpolated, so cars cannot tunnel through each other
+#    (the grid starts within COLLISION_MAX_DT of t = 0, see densify)
+coarse = 0.1 + np.arange(8) * 0.5
+ego_traj = generate_trajectories(np.array([0.0, 0.0, 30.0]), timestamps=coarse)[0]
+parked = [np.array([[67.5, 0.0, 0.0]] * len(coarse))]
+print("Samples only:", check_collision(ego_traj, parked))
+print("Interpolated:", check_collision(ego_traj, parked, timestamps=coarse))
+assert check_collision(ego_traj, parked, timestamps=coarse)[0]
+
+dense, dense_t, idx = densify(ego_traj, coarse, 0.15)
+assert np.max(np.diff(dense_t)) <= 0.15 + 1e-9 and idx[-1] == len(coarse) - 1
+assert dense_t[0] == coarse[0] <= 0.15
+
+# A grid whose first step is too long to interpolate is rejected, rather
+# than hiding a collision in [0, ts[0]]
+late = np.arange(1, 9) * 0.5
+ego_traj = generate_trajectories(np.array([0.0, 0.0, 30.0]), timestamps=late)[0]
+parked = [np.array([[7.5, 0.0, 0.0]] * len(late))]
+try:
+    check_collision(ego_traj, parked, timestamps=late)
+    raise AssertionError("grid starting at 0.5 s was accepted")
+except ValueError as e:
+    print("Rejected:", e)
+
+# 5. Comfort cost counts per-step acceleration, not per-step speed change
+grid = np.array([0.1, 0.2, 0.5])
+sharp = np.array([[0.0, 0.0, 10.0], [1.0, 0.0, 9.0], [4.0, 0.0, 9.0]])
+gentle = np.array([[0.0, 0.0, 10.0], [1.0, 0.0, 10.0], [4.0, 0.0, 9.0]])
+print("Comfort sharp/gentle:", trajectory_comfort_cost(sharp, grid),
+      trajectory_comfort_cost(gentle, grid))
+assert np.isclose(trajectory_comfort_cost(sharp, grid), 0.4 * (10.0 + 0.0) / 2)
+assert np.isclose(trajectory_comfort_cost(gentle, grid), 0.4 * (0.0 + 1.0 / 0.3) / 2)
+assert trajectory_comfort_cost(sharp) == trajectory_comfort_cost(gentle) == 1.0
+# Uniform grid: identical to the default cost
+assert np.isclose(trajectory_comfort_cost(default[1], uniform_time_grid()),
+                  trajectory_comfort_cost(default[1]))
+
+# 6. Full pipeline on the multi-resolution grid
+trajs = generate_trajectories(ego_state, timestamps=ts)
+others_state = np.array([[60.0, 3.5, 10.0], [40.0, 0.0, 25.0], [30.0, 7.0, 22.0]])
+risks = estimate_risk_for_all(trajs, others_state, n_samples=30,
+                              rng=np.random.default_rng(0), timestamps=ts)
+best_idx, scores = select_best_trajectory(trajs, risks, timestamps=ts)
+print("Comfort:", comfort_costs(trajs, ts))
+print("Risks:", [round(r["collision_prob"], 2) for r in risks])
+print("Best trajectory:", best_idx + 1)
@@ -12,3 +12,8 @@ print("Number of trajectories:", len(trajs))
 for i, traj in enumerate(trajs):
     print(f"\nTrajectory {i+1} (first 5 points):")
     print(traj[:5])
+
+# Uniform grid: lane change follows alpha = t / (T - 1) exactly
+T = len(trajs[2])
+expected_y = [3.5 + 3.5 * np.sin(t / (T - 1) * np.pi / 2) for t in range(T)]
+assert np.array_equal(trajs[2][:, 1], expected_y)
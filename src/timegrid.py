@@ -0,0 +1,83 @@
+import numpy as np
+
+
+def uniform_time_grid(dt=0.1, horizon=3.0):
+    """Timestamps (s) of the T = int(horizon / dt) states after t = 0."""
+    return dt * np.arange(1, int(horizon / dt) + 1)
+
+
+def multires_time_grid(fine_dt=0.1, fine_horizon=1.0, coarse_dt=0.3, horizon=7.0):
+    """
+    Non-uniform grid: fine steps up to fine_horizon, coarse steps after it.
+    The defaults cover 7 s with 30 states, the step count of the uniform
+    3 s / 0.1 s grid.
+    """
+    n_fine = int(round(fine_horizon / fine_dt))
+    n_coarse = int(round((horizon - n_fine * fine_dt) / coarse_dt))
+    fine = fine_dt * np.arange(1, n_fine + 1)
+    coarse = n_fine * fine_dt + coarse_dt * np.arange(1, n_coarse + 1)
+    return np.concatenate([fine, coarse])
+
+
+def step_sizes(timestamps):
+    """Length of each step: dt_k = t_k - t_{k-1}, with t_{-1} = 0."""
+    ts = np.asarray(timestamps, dtype=float)
+    return np.diff(ts, prepend=0.0)
+
+
+def resolve_time_grid(dt=0.1, horizon=3.0, timestamps=None):
+    """
+    Timestamps and step sizes used by every stage.
+    If timestamps is given, dt and horizon are ignored.
+    Returns:
+        timestamps: (T,) array
+        dts: (T,) array of step sizes
+    """
+    if timestamps is None:
+        # Exact dt per step, as the uniform code paths always used
+        timestamps = uniform_time_grid(dt, horizon)
+        return timestamps, np.full(len(timestamps), float(dt))
+    timestamps = np.asarray(timestamps, dtype=float)
+    dts = step_sizes(timestamps)
+    if np.any(dts <= 0):
+        raise ValueError("timestamps must be positive and strictly increasing")
+    return timestamps, dts
+
+
+def densify(trajs, timestamps, max_dt):
+    """
+    Linearly interpolate states so consecutive samples are at most max_dt apart.
+    The state at t = 0 is not part of trajs, so the first step cannot be
+    subdivided: ValueError if ts[0] > max_dt.
+
+    trajs: (..., T, 3) array sampled at timestamps
+    Returns:
+        dense: (..., T', 3) array
+        dense_times: (T',) array, includes every original timestamp
+        coarse_idx: (T',) int array, index of the original step each dense
+                    sample belongs to (the first original timestamp >= it)
+    """
+    ts = np.asarray(timestamps, dtype=float)
+    if len(ts) and ts[0] > max_dt + 1e-9:
+        raise ValueError(
+            f"first timestamp {ts[0]:g} s is more than {max_dt:g} s after t = 0; "
+            f"the first step cannot be interpolated"
+        )
+    n_sub = np.ones(len(ts), dtype=int)
+    n_sub[1:] = np.maximum(1, np.ceil(np.diff(ts) / max_dt - 1e-9).astype(int))
+
+    # Fractional positions along the original index axis
+    pos = [np.zeros(1)]
+    for k in range(1, len(ts)):
+        pos.append(k - 1 + np.arange(1, n_sub[k] + 1) / n_sub[k])
+    pos = np.concatenate(pos)
+
+    lo = np.minimum(np.floor(pos).astype(int), len(ts) - 1)
+    hi = np.minimum(lo + 1, len(ts) - 1)
+    w = (pos - lo)[:, None]
+
+    trajs = np.asarray(trajs)
+    dense = trajs[..., lo, :] * (1.0 - w) + trajs[..., hi, :] * w
+    dense_times = ts[lo] * (1.0 - w[:, 0]) + ts[hi] * w[:, 0]
+    coarse_idx = np.ceil(pos - 1e-9).astype(int)
+    return dense, dense_times, coarse_idx
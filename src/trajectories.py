@@ -1,11 +1,17 @@
 import numpy as np
+from timegrid import resolve_time_grid
 
-def generate_trajectories(ego_state, lane_width=3.5, dt=0.1, horizon=3.0):
+def generate_trajectories(ego_state, lane_width=3.5, dt=0.1, horizon=3.0,
+                          timestamps=None):
     
     """Returns a list of candidate trajectories for the ego vehicle.
-    Each trajectory is a sequence of [x, y, v] states over time."""
+    Each trajectory is a sequence of [x, y, v] states over time.
+    timestamps: optional (T,) array of state times for a non-uniform grid
+    (overrides dt and horizon)."""
     x0, y0, v0 = ego_state
-    T = int(horizon / dt)
+    if timestamps is not None:
+        _, dt = resolve_time_grid(timestamps=timestamps)
+    T = int(horizon / dt) if np.isscalar(dt) else len(dt)
 
     return [
         keep_lane(x0, y0, v0, dt, T),
@@ -18,9 +24,10 @@ def generate_trajectories(ego_state, lane_width=3.5, dt=0.1, horizon=3.0):
 def keep_lane(x0, y0, v0, dt, T):
     traj = []
     x, y, v = x0, y0, v0
+    dts = np.broadcast_to(dt, (T,))
 
-    for _ in range(T):
-        x += v * dt
+    for k in range(T):
+        x += v * dts[k]
         traj.append([x, y, v])
 
     return np.array(traj)
@@ -29,10 +36,11 @@ def keep_lane(x0, y0, v0, dt, T):
 def brake(x0, y0, v0, dt, T, decel=-2.0):
     traj = []
     x, y, v = x0, y0, v0
+    dts = np.broadcast_to(dt, (T,))
 
-    for _ in range(T):
-        v = max(0.0, v + decel * dt)
-        x += v * dt
+    for k in range(T):
+        v = max(0.0, v + decel * dts[k])
+        x += v * dts[k]
         traj.append([x, y, v])
 
     return np.array(traj)
@@ -42,15 +50,24 @@ def lane_change(x0, y0, v0, dt, T, direction, lane_width):
     traj = []
     x, y, v = x0, y0, v0
 
+    dts = np.broadcast_to(dt, (T,))
+    # Fraction of the manoeuvre completed at each state
+    if np.isscalar(dt):
+        alphas = [t / (T - 1) for t in range(T)]
+    else:
+        # Non-uniform grid: time-based fraction
+        ts = np.cumsum(dts)
+        alphas = (ts - ts[0]) / (ts[-1] - ts[0])
+
     if direction == "left":
         target_y = y + lane_width
     else:
         target_y = y - lane_width
 
     for t in range(T):
-        alpha = t / (T - 1)
+        alpha = alphas[t]
         y_t = y + (target_y - y) * np.sin(alpha * np.pi / 2)
-        x += v * dt
+        x += v * dts[t]
         traj.append([x, y_t, v])
 
     return np.array(traj)